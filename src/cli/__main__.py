@@ -18,7 +18,7 @@ if TYPE_CHECKING:  # 型チェック時は stub を想定
     from dotenv import load_dotenv as _load_dotenv_type  # noqa: F401
 from src.logging.init import log_summary, setup_logging
 from src.services.orchestrator import ProcessingError, process_all
-from src.services.summary import render_summary_line
+from src.services.summary import render_summary_fields
 
 """CLI entrypoint (scaffold).
 
@@ -121,7 +121,8 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
 
 def _inspect_data(cfg) -> int:
 
-    from src.excel.reader import normalize_sheet, read_excel_file
+    from src.excel.reader import normalize_sheet, read_excel_file, resolve_engine
+    engine = resolve_engine(getattr(cfg, "excel_engine", None))
     directory = Path(cfg.source_directory)
     if not directory.exists():
         print(f"inspect: directory not found: {directory}")
@@ -133,7 +134,7 @@ def _inspect_data(cfg) -> int:
     for f in excel_files:
         print(f"FILE: {f.name}")
         try:
-            raw = read_excel_file(f, target_sheets=None)
+            raw = read_excel_file(f, target_sheets=None, engine=engine)
         except Exception as e:  # pragma: no cover
             print(f"  read_error: {e}")
             continue
@@ -228,10 +229,8 @@ def main(argv: list[str] | None = None) -> int:
     total_files = result.success_files + result.failed_files
     
     # Format and print SUMMARY line according to contract using summary service
-    summary_line = render_summary_line(total_files, result)
-    # Extract content after "SUMMARY " since log_summary adds the "SUMMARY " prefix
-    summary_content = summary_line[8:]  # Remove "SUMMARY " prefix
-    log_summary(summary_content)
+    # (log_summary adds the "SUMMARY " prefix, so only the fields are rendered)
+    log_summary(render_summary_fields(total_files, result))
     
     # Determine exit code
     if result.failed_files > 0 and result.success_files > 0:
@@ -57,6 +57,13 @@ class ImportConfig:
     timezone: str
     database: DatabaseConfig
     null_sentinels: list[str] | None = None
+    excel_engine: str | None = None  # None = pandas 既定 (openpyxl)
+    files_per_transaction: int = 1  # >1: N ファイルを1トランザクション + ファイル毎 SAVEPOINT
+    read_workers: int = 1  # Excel 読込の並列スレッド数 (DB 挿入は直列)
+    read_executor: str = "thread"  # "process": 読込ワーカーをプロセスにする (GIL を回避)
+    page_size: int = 1000  # execute_values の1文あたり行数 (R-006)
+    copy_threshold: int = 0  # >0: RETURNING 不要かつこの行数以上は COPY FROM STDIN (0 = 無効)
+    diagnostics: bool = False  # True: シート毎にテーブル列定義との差分を検査 (DEBUG ログ時も有効)
 
 
 def _validate_config_schema(data: dict[str, Any]) -> None:
@@ -117,4 +124,11 @@ def load_config(path: Path) -> ImportConfig:
         timezone=tz,
         database=db,
         null_sentinels=data.get("null_sentinels"),
+        excel_engine=data.get("excel_engine"),
+        files_per_transaction=data.get("files_per_transaction", 1),
+        read_workers=data.get("read_workers", 1),
+        read_executor=data.get("read_executor", "thread"),
+        page_size=data.get("page_size", 1000),
+        copy_threshold=data.get("copy_threshold", 0),
+        diagnostics=data.get("diagnostics", False),
     )
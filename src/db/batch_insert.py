@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import io
 import os
 import time
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence, Set
 from dataclasses import dataclass
+from datetime import date, datetime
+from datetime import time as dt_time
 from typing import Any
 
+import numpy as np
+
 """DB batch insert scaffolding.
 
 R-001 Decision: 初版は psycopg2.extras.execute_values を用いたバッチ INSERT。
@@ -18,6 +23,8 @@ FR-006/FR-007/FR-029: sequence / fk 伝播列は除外済みの前提でここ
 この段階ではインタフェースと失敗時例外ラップを提示し、テストはモックで呼び出し確認のみを行う。
 
 T023 Enhancement: Added metrics callback support for batch timing instrumentation.
+
+copy_insert: RETURNING 不要な大量行は COPY FROM STDIN (text 形式) で投入する。
 """
 
 try:  # pragma: no cover - optional until psycopg2 present at runtime
@@ -46,6 +53,33 @@ class InsertResult:
     returned_values: list[tuple[Any, ...]] | None = None
 
 
+def _load_blob_columns(
+    rows_list: list[Sequence[Any]],
+    columns: Sequence[str],
+    blob_columns: Set[str],
+    source_directory: str,
+) -> list[Sequence[Any]]:
+    """Replace blob column values (relative file paths) with the file contents."""
+    blob_col_indices = [i for i, col in enumerate(columns) if col in blob_columns]
+    if not blob_col_indices:
+        return rows_list
+    processed_rows: list[Sequence[Any]] = []
+    for row in rows_list:
+        row_list = list(row)
+        for idx in blob_col_indices:
+            if row_list[idx] is not None:
+                # Read file content as binary data
+                rel_path = str(row_list[idx])
+                abs_path = os.path.abspath(os.path.join(source_directory, rel_path))
+                try:
+                    with open(abs_path, 'rb') as f:
+                        row_list[idx] = f.read()
+                except Exception as e:
+                    raise BatchInsertError(f"Failed to read blob file {abs_path}: {e}") from e
+        processed_rows.append(tuple(row_list))
+    return processed_rows
+
+
 def batch_insert(
     cursor: Any,
     table: str,
@@ -54,8 +88,9 @@ def batch_insert(
     returning: bool = False,
     page_size: int = 1000,
     metrics_callback: Callable[[BatchMetrics], None] | None = None,
-    blob_columns: set[str] | None = None,
+    blob_columns: Set[str] | None = None,
     source_directory: str | None = None,
+    returning_columns: Sequence[str] | None = None,
 ) -> InsertResult:
     """Perform batched INSERT using psycopg2.extras.execute_values.
 
@@ -83,6 +118,8 @@ def batch_insert(
             # Use stats in FileStat construction
     blob_columns: Set of column names that are of blob type. These columns are treated as file paths, and their binary data will be read from the files.
     source_directory: Base directory used to resolve relative paths when blob_columns is specified.
+    returning_columns: RETURNING 対象列 (None なら RETURNING *)。指定時 returned_values の
+        各タプルはこの列順になる。
     """
     if execute_values is None:
         raise BatchInsertError("psycopg2 not available")
@@ -94,23 +131,7 @@ def batch_insert(
     # Convert blob column values from relative paths to absolute paths
     # and read file contents
     if blob_columns and source_directory:
-        blob_col_indices = [i for i, col in enumerate(columns) if col in blob_columns]
-        if blob_col_indices:
-            processed_rows = []
-            for row in rows_list:
-                row_list = list(row)
-                for idx in blob_col_indices:
-                    if row_list[idx] is not None:
-                        # Read file content as binary data
-                        rel_path = str(row_list[idx])
-                        abs_path = os.path.abspath(os.path.join(source_directory, rel_path))
-                        try:
-                            with open(abs_path, 'rb') as f:
-                                row_list[idx] = f.read()
-                        except Exception as e:
-                            raise BatchInsertError(f"Failed to read blob file {abs_path}: {e}") from e
-                processed_rows.append(tuple(row_list))
-            rows_list = processed_rows
+        rows_list = _load_blob_columns(rows_list, columns, blob_columns, source_directory)
 
     cols_sql = ",".join(f'"{c}"' for c in columns)
     
@@ -119,12 +140,22 @@ def batch_insert(
     base_sql = f"INSERT INTO {table} ({cols_sql}) VALUES %s"
     
     if returning:
-        base_sql += " RETURNING *"  # 後続で必要列限定最適化予定 (FR-029)
+        if returning_columns:
+            base_sql += " RETURNING " + ",".join(f'"{c}"' for c in returning_columns)
+        else:
+            base_sql += " RETURNING *"
 
     # T023: Batch timing instrumentation
+    returned = None
     start_time = time.time()
     try:
-        execute_values(cursor, base_sql, rows_list, page_size=page_size)
+        if returning:
+            # fetch=True: 全ページの RETURNING 行を集める (fetchall() は最終ページ分のみ)
+            returned = execute_values(
+                cursor, base_sql, rows_list, page_size=page_size, fetch=True
+            )
+        else:
+            execute_values(cursor, base_sql, rows_list, page_size=page_size)
     except Exception as e:  # pragma: no cover - will be covered when real DB tests added
         raise BatchInsertError(str(e)) from e
     finally:
@@ -139,11 +170,99 @@ def batch_insert(
             )
             metrics_callback(metrics)
 
-    returned = None
-    if returning:
-        try:
-            returned = cursor.fetchall()
-        except Exception as e:  # pragma: no cover
-            raise BatchInsertError(f"failed fetching RETURNING rows: {e}") from e
-
     return InsertResult(inserted_rows=len(rows_list), returned_values=returned)
+
+
+# COPY text 形式で特別扱いされる文字のエスケープ (str.translate は一括置換)
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+# pandas.NA / pandas.NaT (pandas を import せず型名で判定)
+_PANDAS_NA_TYPES = frozenset({"NAType", "NaTType"})
+
+
+def _copy_text_value(value: Any) -> str:
+    """Format a single value for COPY ... FROM STDIN text format.
+
+    Excel 読込が返す値 (numpy スカラー / NaN / pandas NA / Timestamp) を
+    execute_values の型適合と同じ結果になるよう明示的に変換する。
+    整数値の float (例: 1.0) は整数表記にする: INSERT では整数列へ暗黙 cast
+    されるが、COPY の整数列は "1.0" を受け付けないため。
+    """
+    if value is None or type(value).__name__ in _PANDAS_NA_TYPES:
+        return "\\N"
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, (bool, np.bool_)):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex 形式; COPY text ではバックスラッシュ自体を二重化する
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, np.datetime64):
+        if np.isnat(value):
+            return "\\N"
+        return np.datetime_as_string(value, unit="us")
+    if isinstance(value, np.generic):
+        value = value.item()  # np.int64 / np.float32 等 -> Python スカラー
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return "\\N"
+        if value.is_integer():
+            return str(int(value))
+        return repr(value)
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_insert(
+    cursor: Any,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    metrics_callback: Callable[[BatchMetrics], None] | None = None,
+    blob_columns: Set[str] | None = None,
+    source_directory: str | None = None,
+) -> InsertResult:
+    """Bulk load rows with ``COPY ... FROM STDIN`` (no RETURNING support).
+
+    Same contract as :func:`batch_insert` with ``returning=False``; callers
+    that need parent PKs back must keep using ``batch_insert``. NULL (None,
+    NaN, pandas NA/NaT) is sent as ``\\N``, numpy scalars are converted to
+    Python values, and tabs / newlines / backslashes inside strings are escaped.
+    """
+    rows_list = list(rows)
+    if not rows_list:
+        return InsertResult(inserted_rows=0, returned_values=None)
+
+    if blob_columns and source_directory:
+        rows_list = _load_blob_columns(rows_list, columns, blob_columns, source_directory)
+
+    buf = io.StringIO()
+    write = buf.write
+    for row in rows_list:
+        write("\t".join(map(_copy_text_value, row)))
+        write("\n")
+    buf.seek(0)
+
+    cols_sql = ",".join(f'"{c}"' for c in columns)
+    sql = f"COPY {table} ({cols_sql}) FROM STDIN WITH (FORMAT text)"
+
+    start_time = time.time()
+    try:
+        cursor.copy_expert(sql, buf)
+    except Exception as e:  # pragma: no cover - will be covered when real DB tests added
+        raise BatchInsertError(str(e)) from e
+    finally:
+        end_time = time.time()
+        if metrics_callback is not None:
+            metrics_callback(
+                BatchMetrics(
+                    batch_size=len(rows_list),
+                    elapsed_seconds=end_time - start_time,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+            )
+
+    return InsertResult(inserted_rows=len(rows_list), returned_values=None)
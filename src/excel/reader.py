@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import importlib.util
+import logging
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Set
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,6 +19,15 @@ FR-016: 設定で期待される列が欠落した場合はファイルエラー
 """
 
 
+logger = logging.getLogger(__name__)
+
+# 設定 excel_engine -> (pandas engine 名, 必要モジュール)
+_ENGINE_MODULES = {
+    "openpyxl": "openpyxl",
+    "calamine": "python_calamine",
+}
+
+
 class SheetHeaderError(Exception):
     """Raised when header row (2nd line) is missing or invalid."""
 
@@ -26,11 +38,47 @@ class MissingColumnsError(Exception):
 class SheetData:
     sheet_name: str
     columns: list[str]
-    rows: list[dict[str, Any]]  # 正規化済 (列名→値)
+    columns_data: dict[str, list[Any]]  # 正規化済 (列名→値リスト, 列指向)
+    row_count: int
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the sheet has no data rows (header-only or all blank)."""
+        return self.row_count == 0
+
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        """Row-major view (列名→値 dict per row), built on demand."""
+        if not self.columns_data:
+            return [{} for _ in range(self.row_count)]
+        names = list(self.columns_data)
+        return [
+            dict(zip(names, values, strict=True))
+            for values in zip(*self.columns_data.values(), strict=True)
+        ]
+
+
+def resolve_engine(engine: str | None) -> str | None:
+    """Map the configured ``excel_engine`` to a pandas engine name.
+
+    calamine (Rust 実装) は python-calamine が任意依存のため、未導入なら
+    警告を出して pandas 既定 (openpyxl) にフォールバックする。
+    """
+    if engine is None:
+        return None
+    module = _ENGINE_MODULES.get(engine)
+    if module is None:
+        raise ValueError(f"unsupported excel_engine: {engine!r}")
+    if importlib.util.find_spec(module) is None:
+        logger.warning(
+            "excel_engine=%s requested but %s is not installed; using openpyxl", engine, module
+        )
+        return None
+    return engine
 
 
 def read_excel_file(
-    path: Path, target_sheets: Iterable[str] | None = None
+    path: Path, target_sheets: Iterable[str] | None = None, engine: str | None = None
 ) -> dict[str, pd.DataFrame]:
     """Read an Excel file returning raw DataFrames keyed by sheet name.
 
@@ -38,68 +86,114 @@ def read_excel_file(
     ----------
     path: Excel ファイルパス
     target_sheets: 対象シート制限 (None なら全シート)
+    engine: pandas の Excel エンジン (``resolve_engine`` 済み; None なら既定)
     """
     dfs: dict[str, pd.DataFrame] = {}
-    xls = pd.ExcelFile(path)
+    xls = pd.ExcelFile(path, engine=engine)
     for name in xls.sheet_names:
-        if target_sheets is not None and str(name) not in target_sheets:
+        # intern: 設定側シート名 (同じく intern 済) との dict 照合でハッシュ再計算を回避
+        sheet_name = sys.intern(str(name))
+        if target_sheets is not None and sheet_name not in target_sheets:
             continue
         df = xls.parse(name, header=None)  # ヘッダなしで生読み (後で2行目をヘッダとして適用)
-        dfs[str(name)] = df
+        dfs[sheet_name] = df
     return dfs
 
 
-def normalize_sheet(
+def iter_sheet_rows(
     df: pd.DataFrame,
     sheet_name: str,
-    expected_columns: set[str] | None = None,
-    default_values: dict[str, Any] | None = None,
-    null_sentinels: set[str] | None = None,
-) -> SheetData:
-    """Normalize a raw DataFrame using second row as header.
-
-    Steps:
-    1. Validate at least 2 rows exist (1: title, 2: header)
-    2. Extract header from second row (index=1)
-    3. Remaining rows (index>=2) become data rows (index offset not stored here)
-    4. Validate expected columns subset
+    expected_columns: Set[str] | None = None,
+    default_values: Mapping[str, Any] | None = None,
+    null_sentinels: Set[str] | None = None,
+) -> tuple[list[str], Iterator[tuple[Any, ...]]]:
+    """Validate header and return (columns, lazy iterator of normalized row tuples).
+
+    ヘッダ検証 (2行目存在 / 期待列) は即時実行し、データ行の正規化は遅延評価。
+    行は dict を作らず列順タプルで返すため、消費側で1行ずつ処理・破棄できる。
     """
     if df.shape[0] < 2:
         raise SheetHeaderError(f"sheet '{sheet_name}' lacks second row header")
     header_series = df.iloc[1]
     columns = [str(c).strip() for c in header_series.tolist()]
+
+    if expected_columns is not None:
+        missing = expected_columns - set(columns)
+        if missing:
+            raise MissingColumnsError(f"sheet '{sheet_name}' missing columns: {sorted(missing)}")
+
+    # ヘッダのみ (データ行なし) のシートは行正規化自体を省略
+    if df.shape[0] == 2:
+        return columns, iter(())
     # Data rows start from index 2
-    data_part = df.iloc[2:]
-    rows: list[dict[str, Any]] = []
-    for _, raw in data_part.iterrows():
-        # Build row dict skipping trailing NaNs only if entire row is NaN
-        if raw.isna().all():
+    return columns, _iter_data_rows(df.iloc[2:], columns, default_values, null_sentinels)
+
+
+def _iter_data_rows(
+    data_part: pd.DataFrame,
+    columns: list[str],
+    default_values: Mapping[str, Any] | None,
+    null_sentinels: Set[str] | None,
+) -> Iterator[tuple[Any, ...]]:
+    # itertuples(name=None): iterrows と違い行毎の Series を生成しない
+    for raw in data_part.itertuples(index=False, name=None):
+        # Skip rows only if entire row is NaN
+        if all(pd.isna(v) for v in raw):
             continue
-        row_dict: dict[str, Any] = {}
-        for col, val in zip(columns, raw.tolist(), strict=False):
+        values: list[Any] = []
+        for col, val in zip(columns, raw, strict=False):
             if pd.isna(val):
                 if default_values and col in default_values:
-                    row_dict[col] = default_values[col]
+                    values.append(default_values[col])
                 else:
-                    row_dict[col] = None
-            else:
-                if isinstance(val, str):
-                    stripped = val.strip()
-                    upper = stripped.upper()
-                    # NULL サニタイズ
-                    if null_sentinels and upper in null_sentinels:
-                        row_dict[col] = None
-                        continue
-                    # 空文字 / ホワイトスペースのみ -> default
-                    if stripped == "" and default_values and col in default_values:
-                        row_dict[col] = default_values[col]
-                        continue
-                row_dict[col] = val
-        rows.append(row_dict)
+                    values.append(None)
+                continue
+            if isinstance(val, str):
+                stripped = val.strip()
+                upper = stripped.upper()
+                # NULL サニタイズ
+                if null_sentinels and upper in null_sentinels:
+                    values.append(None)
+                    continue
+                # 空文字 / ホワイトスペースのみ -> default
+                if stripped == "" and default_values and col in default_values:
+                    values.append(default_values[col])
+                    continue
+            values.append(val)
+        yield tuple(values)
 
-    if expected_columns is not None:
-        missing = expected_columns - set(columns)
-        if missing:
-            raise MissingColumnsError(f"sheet '{sheet_name}' missing columns: {sorted(missing)}")
 
-    return SheetData(sheet_name=sheet_name, columns=columns, rows=rows)
+def normalize_sheet(
+    df: pd.DataFrame,
+    sheet_name: str,
+    expected_columns: Set[str] | None = None,
+    default_values: Mapping[str, Any] | None = None,
+    null_sentinels: Set[str] | None = None,
+) -> SheetData:
+    """Normalize a raw DataFrame using second row as header.
+
+    Steps:
+    1. Validate at least 2 rows exist (1: title, 2: header)
+    2. Extract header from second row (index=1)
+    3. Validate expected columns subset
+    4. Remaining rows (index>=2) become data rows (index offset not stored here)
+
+    Materializing wrapper over ``iter_sheet_rows``. Values are stored
+    column-major (``columns_data``) so no per-row dict is allocated.
+    """
+    columns, rows_iter = iter_sheet_rows(
+        df,
+        sheet_name,
+        expected_columns=expected_columns,
+        default_values=default_values,
+        null_sentinels=null_sentinels,
+    )
+    rows = list(rows_iter)
+    # zip(*rows) で C レベル転置 (重複列名は従来の dict 同様に後勝ち)
+    column_lists = [list(col) for col in zip(*rows, strict=True)] if rows else [[] for _ in columns]
+    return SheetData(
+        sheet_name=sheet_name,
+        columns=columns,
+        columns_data=dict(zip(columns, column_lists, strict=True)),
+        row_count=len(rows),
+    )
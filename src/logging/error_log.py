@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -48,6 +49,9 @@ class ErrorLogBuffer:
     def append(self, record: ErrorRecord) -> None:
         self._records.append(record)
 
+    def extend(self, records: Iterable[ErrorRecord]) -> None:
+        self._records.extend(records)
+
     def __len__(self) -> int:  # pragma: no cover (trivial)
         return len(self._records)
 
@@ -56,7 +60,6 @@ class ErrorLogBuffer:
             return self.file_path  # 空でもファイルパス確定のみ (要件次第で作成抑止可)
         fp = self.file_path
         with fp.open("a", encoding="utf-8") as f:
-            for r in self._records:
-                f.write(r.to_json_line() + "\n")
+            f.writelines(f"{r.to_json_line()}\n" for r in self._records)
         self._records.clear()
         return fp
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 
 """Config dataclasses for Excel -> PostgreSQL import tool.
 
@@ -37,18 +39,22 @@ class SheetMappingConfig:
     """
     sheet_name: str  # Excel sheet name (key in sheet_mappings dict)
     table_name: str  # Target database table name
-    sequence_columns: set[str]  # Columns with auto-generated values (ignore Excel values)
-    fk_propagation_columns: set[str]  # Columns that get values from parent records
-    default_values: dict[str, object] | None = None  # 空セル時適用デフォルト
-    null_sentinels: set[str] | None = None  # 文字列→NULL 変換対象 (大文字化済想定)
-    blob_columns: set[str] | None = None  # pg_read_binary_file でファイル読み込みする列
+    sequence_columns: frozenset[str]  # Columns with auto-generated values (ignore Excel values)
+    fk_propagation_columns: frozenset[str]  # Columns that get values from parent records
+    default_values: Mapping[str, object] | None = None  # 空セル時適用デフォルト (読み取り専用)
+    null_sentinels: frozenset[str] | None = None  # 文字列→NULL 変換対象 (大文字化済想定)
+    blob_columns: frozenset[str] | None = None  # pg_read_binary_file でファイル読み込みする列
+    returning_pk_column: str | None = None  # 親として RETURNING する PK 列 (sequences の "table.col" 指定)
+    # RETURNING * 時の PK 列候補 (sequences キー由来, 設定順)
+    pk_candidates: tuple[str, ...] = ()
     
-    @property
-    def expected_columns(self) -> set[str]:
+    @cached_property
+    def expected_columns(self) -> frozenset[str]:
         """Derived property: columns that must exist in Excel header (FR-016).
         
         These are all columns except those that are auto-generated or propagated.
         Used for validating that required columns are present in the Excel file.
+        Computed once per mapping (validated for every sheet using it).
         """
         # 暫定実装 (T015 改訂):
         #  - default_values 指定列: 補完対象なのでヘッダに存在している必要がある
@@ -65,7 +71,15 @@ class SheetMappingConfig:
         required.update(self.fk_propagation_columns)
         if self.blob_columns:
             required.update(self.blob_columns)
-        return required
+        return frozenset(required)
+
+    @cached_property
+    def ignored_columns(self) -> frozenset[str]:
+        """Derived property: sequence + FK propagation columns (FR-006, FR-007).
+
+        Computed once per mapping; reused for every sheet processed with it.
+        """
+        return frozenset(self.sequence_columns | self.fk_propagation_columns)
 
 
 @dataclass(frozen=True)
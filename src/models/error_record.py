@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import asdict, dataclass
-from datetime import UTC, datetime
 
 """ErrorRecord model for error logging.
 
@@ -20,6 +21,29 @@ __all__ = [
     "ErrorRecord",
 ]
 
+# UTC 秒部分 (小数秒と "Z" は呼び出し毎に付加)
+_SECOND_FMT = "%Y-%m-%dT%H:%M:%S"
+
+# スレッド毎の直近 (epoch 秒, 秒部分文字列)。同一秒内なら strftime は1回
+_local = threading.local()
+
+
+def _utc_timestamp(ts_ns: int | None = None) -> str:
+    """Format ``ts_ns`` (default: now) as an ISO8601 UTC string with microseconds.
+
+    Output matches ``datetime.isoformat()`` with ``+00:00`` replaced by ``Z``:
+    the fraction is omitted when the microsecond part is zero.
+    """
+    sec, rem_ns = divmod(time.time_ns() if ts_ns is None else ts_ns, 1_000_000_000)
+    cached = getattr(_local, "last", None)
+    if cached is not None and cached[0] == sec:
+        prefix = cached[1]
+    else:
+        prefix = time.strftime(_SECOND_FMT, time.gmtime(sec))
+        _local.last = (sec, prefix)
+    micros = rem_ns // 1_000
+    return f"{prefix}.{micros:06d}Z" if micros else f"{prefix}Z"
+
 
 @dataclass(frozen=True)
 class ErrorRecord:
@@ -41,7 +65,14 @@ class ErrorRecord:
     db_message: str
 
     @staticmethod
-    def create(file: str, sheet: str, row: int, error_type: str, db_message: str) -> ErrorRecord:
+    def create(
+        file: str,
+        sheet: str,
+        row: int,
+        error_type: str,
+        db_message: str,
+        ts_ns: int | None = None,
+    ) -> ErrorRecord:
         """Create a new ErrorRecord with current UTC timestamp.
 
         Parameters:
@@ -50,19 +81,14 @@ class ErrorRecord:
             row: Row number (1-based). Use -1 for file-level errors where row is unknown
             error_type: Error classification in UPPER_SNAKE_CASE format
             db_message: Database error message or description
+            ts_ns: Event time from ``time.time_ns()`` (None = now)
 
         Returns:
             New ErrorRecord instance with current UTC timestamp
         """
-        ts = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-        return ErrorRecord(
-            timestamp=ts,
-            file=file,
-            sheet=sheet,
-            row=row,
-            error_type=error_type,
-            db_message=db_message,
-        )
+        ts = _utc_timestamp(ts_ns)
+        # 位置引数で生成 (kwargs dict 構築を省略)
+        return ErrorRecord(ts, file, sheet, row, error_type, db_message)
 
     def to_json_line(self) -> str:
         """Serialize ErrorRecord to JSON Lines format.
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import statistics
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -63,6 +64,41 @@ class MetricsSnapshot:
     last_update: datetime  # 最終表示更新時刻
 
 
+class FileStatsAccumulator:
+    """Column-wise (SoA) collector for per-file stats during processing.
+
+    Appends primitive values to parallel columns instead of building one
+    FileStat per file inside the loop; FileStat objects are materialized
+    once at the end via ``to_file_stats()``.
+    """
+
+    def __init__(self) -> None:
+        self.file_names: list[str] = []
+        self.statuses: list[str] = []
+        self.inserted_rows = array("q")
+        self.elapsed_seconds = array("d")
+
+    def add(self, file_name: str, status: str, inserted_rows: int, elapsed_seconds: float) -> None:
+        """Record one processed file."""
+        self.file_names.append(file_name)
+        self.statuses.append(status)
+        self.inserted_rows.append(inserted_rows)
+        self.elapsed_seconds.append(elapsed_seconds)
+
+    def __len__(self) -> int:
+        return len(self.file_names)
+
+    def to_file_stats(self) -> list[FileStat]:
+        """Materialize FileStat objects in insertion order."""
+        return [
+            FileStat(file_name=n, status=s, inserted_rows=r, elapsed_seconds=e)
+            for n, s, r, e in zip(
+                self.file_names, self.statuses, self.inserted_rows, self.elapsed_seconds,
+                strict=True,
+            )
+        ]
+
+
 class BatchStatsAccumulator:
     """Helper class to accumulate batch timing statistics for FileStat (T029).
     
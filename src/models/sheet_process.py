@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 
 from .config_models import SheetMappingConfig
@@ -31,6 +32,6 @@ class SheetProcess:
     mapping: SheetMappingConfig  # Configuration reference
     rows: list[RowData] | None = None  # Normalized row data (FR-004, FR-005)
     # Auto-sequence/FK propagation excluded columns (FR-006, FR-007, FR-021)
-    ignored_columns: set[str] | None = None
+    ignored_columns: AbstractSet[str] | None = None
     inserted_rows: int = 0  # Successfully committed row count (FR-022)
     error: str | None = None  # Sheet-level error message (FR-008)
\ No newline at end of file
@@ -62,9 +62,20 @@ def needs_returning(
     -------
     bool: True if RETURNING clause should be used, False otherwise
     """
-    # Check if any child tables reference this table's PK
+    # Check if any child tables reference this table's PK (未処理の子が残っていれば True)
+    children = build_parent_child_tables(config).get(table_name)
+    return children is not None and not children <= processed_tables
+
+
+def build_parent_child_tables(config: ImportConfig) -> dict[str, frozenset[str]]:
+    """Map each FK parent table to the child tables that reference it.
+
+    ``needs_returning`` の静的部分。設定から1回だけ構築し、シート毎には
+    ``processed_tables`` との包含判定のみ行えるようにする。
+    """
+    pairs: list[tuple[str, str]] = []
     fp = config.fk_propagations
-    # list 新形式: 子テーブルがまだ processed_tables に含まれていなければ True
+    # list 新形式
     if isinstance(fp, list):
         for entry in fp:
             try:
@@ -74,23 +85,21 @@ def needs_returning(
                 continue
             if not parent_ref or not child_ref or "." not in parent_ref or "." not in child_ref:
                 continue
-            parent_table, _ = parent_ref.split(".", 1)
-            if parent_table != table_name:
-                continue
-            child_table, _ = child_ref.split(".", 1)
-            if child_table not in processed_tables:
-                return True
-    # 旧 dict 形式: 同様に child 側が未処理なら True
+            pairs.append((parent_ref.split(".", 1)[0], child_ref.split(".", 1)[0]))
+    # 旧 dict 形式
     elif isinstance(fp, dict):
         for fk_mapping_key, child_reference in fp.items():
-            if "." in fk_mapping_key:
-                parent_table, _ = fk_mapping_key.split(".", 1)
-                if parent_table == table_name and "." in child_reference:
-                    child_table, _ = child_reference.split(".", 1)
-                    if child_table not in processed_tables:
-                        return True
-    
-    return False
+            if (
+                "." in fk_mapping_key
+                and isinstance(child_reference, str)
+                and "." in child_reference
+            ):
+                pairs.append((fk_mapping_key.split(".", 1)[0], child_reference.split(".", 1)[0]))
+
+    children: dict[str, set[str]] = {}
+    for parent_table, child_table in pairs:
+        children.setdefault(parent_table, set()).add(child_table)
+    return {parent: frozenset(tables) for parent, tables in children.items()}
 
 
 def build_fk_propagation_maps(config: ImportConfig) -> list[FKPropagationMap]:
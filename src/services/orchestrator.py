@@ -1,49 +1,139 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+import sys
+import time
+import zipfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
 from ..config.loader import ImportConfig
-from ..db.batch_insert import BatchInsertError, batch_insert
-from ..excel.reader import MissingColumnsError, SheetHeaderError, normalize_sheet, read_excel_file
+from ..db.batch_insert import BatchInsertError, batch_insert, copy_insert
+from ..excel.reader import (
+    MissingColumnsError,
+    SheetHeaderError,
+    normalize_sheet,
+    read_excel_file,
+    resolve_engine,
+)
 from ..logging.error_log import ErrorLogBuffer, ErrorRecord
 from ..models.config_models import SheetMappingConfig as DomainSheetMappingConfig
 from ..models.excel_file import ExcelFile, FileStatus
-from ..models.processing_result import FileStat, ProcessingResult
+from ..models.processing_result import FileStatsAccumulator, ProcessingResult
 from ..models.sheet_process import SheetProcess
 
 # FK 伝播サービス (T023 統合)
 from .fk_propagation import (
     FKPropagationMap,
     build_fk_propagation_maps,
-    needs_returning,
+    build_parent_child_tables,
 )
 from .progress import ProgressTracker, SheetProgressIndicator
 
 logger = logging.getLogger(__name__)
 
 
-def _diagnose_table_columns(cursor: Any, table: str, insert_columns: list[str]) -> None:
-    """Print diagnostic info about table column presence vs insert columns.
+# テーブル名 -> 既存列集合。スキーマは1回の実行中は不変とみなし process_all 開始時に再構築
+_TABLE_COLUMNS_CACHE: dict[str, frozenset[str]] = {}
+
+
+def clear_table_columns_cache() -> None:
+    """Drop cached ``information_schema.columns`` lookups."""
+    _TABLE_COLUMNS_CACHE.clear()
+
+
+def _prewarm_table_columns(cursor: Any, tables: Iterable[str]) -> None:
+    """Load column sets for all ``tables`` with a single catalog query.
 
-    This is a temporary diagnostic helper; it prints to stdout so that even when
-    logging output is suppressed by progress bars we still see the result.
+    On failure the cache is left empty and ``_diagnose_table_columns`` falls
+    back to per-table queries; the aborted statement is rolled back so the
+    following file transaction can start.
     """
+    names = sorted(set(tables))
+    if not names:
+        return
     try:
         cursor.execute(
-            "SELECT column_name FROM information_schema.columns WHERE table_name = %s",
-            (table,),
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_name = ANY(%s)",
+            (names,),
         )
-        existing = {r[0] for r in cursor.fetchall()}
+        found: dict[str, set[str]] = {name: set() for name in names}
+        for table, column in cursor.fetchall():
+            found.setdefault(table, set()).add(column)
+    except Exception:
+        logger.debug("table column prewarm failed", exc_info=True)
+        try:
+            cursor.execute("ROLLBACK")
+        except Exception:
+            pass
+        return
+    _TABLE_COLUMNS_CACHE.update((t, frozenset(cols)) for t, cols in found.items())
+
+
+# RETURNING 不要かつこの行数以上のシートは COPY FROM STDIN で投入 (既定 0 = 無効, opt-in)
+_DEFAULT_COPY_THRESHOLD = 0
+
+
+def _copy_threshold(raw_config: Any) -> int:
+    threshold = getattr(raw_config, "copy_threshold", _DEFAULT_COPY_THRESHOLD)
+    return threshold if isinstance(threshold, int) else _DEFAULT_COPY_THRESHOLD
+
+
+# R-006 default batch size
+_DEFAULT_PAGE_SIZE = 1000
+
+
+def _page_size(raw_config: Any) -> int:
+    page_size = getattr(raw_config, "page_size", _DEFAULT_PAGE_SIZE)
+    return page_size if isinstance(page_size, int) and page_size > 0 else _DEFAULT_PAGE_SIZE
+
+
+def _diagnostics_enabled(raw_config: Any) -> bool:
+    """Return True when the per-sheet catalog column check should run."""
+    return bool(getattr(raw_config, "diagnostics", False)) or logger.isEnabledFor(logging.DEBUG)
+
+
+def _diagnose_table_columns(cursor: Any, table: str, insert_columns: list[str]) -> None:
+    """Log diagnostic info about table column presence vs insert columns.
+
+    Missing columns are logged as a warning (the insert is going to fail);
+    otherwise the summary is emitted at DEBUG. Column sets are cached per
+    table (see ``_prewarm_table_columns``).
+    """
+    try:
+        existing = _TABLE_COLUMNS_CACHE.get(table)
+        if existing is None:
+            cursor.execute(
+                "SELECT column_name FROM information_schema.columns WHERE table_name = %s",
+                (table,),
+            )
+            existing = frozenset(r[0] for r in cursor.fetchall())
+            _TABLE_COLUMNS_CACHE[table] = existing
         missing = [c for c in insert_columns if c not in existing]
-        extra = [c for c in existing if c not in insert_columns]
-        print(
-            f"[DIAG] table={table} existing_cols={len(existing)} missing={missing if missing else '[]'} extra_not_used={extra[:10]}"
-        )
+        if missing:
+            logger.warning(
+                "[DIAG] table=%s existing_cols=%d missing=%s", table, len(existing), missing
+            )
+        elif logger.isEnabledFor(logging.DEBUG):
+            extra = [c for c in existing if c not in insert_columns]
+            logger.debug(
+                "[DIAG] table=%s existing_cols=%d missing=[] extra_not_used=%s",
+                table,
+                len(existing),
+                extra[:10],
+            )
     except Exception as e:  # pragma: no cover
-        print(f"[DIAG] failed to inspect table columns table={table} err={e}")
+        logger.debug("[DIAG] failed to inspect table columns table=%s err=%s", table, e)
 
 """Service orchestration for Excel -> PostgreSQL import tool.
 
@@ -61,26 +151,301 @@ class ProcessingError(Exception):
     pass
 
 
-def _convert_config_to_domain_mappings(config: ImportConfig) -> dict[str, DomainSheetMappingConfig]:
+# File-level failures that are part of normal operation (bad workbook, missing
+# columns, DB rejects). Anything else reaching the file handler is a bug.
+_EXPECTED_FILE_ERRORS: tuple[type[Exception], ...] = (
+    SheetHeaderError,
+    MissingColumnsError,
+    BatchInsertError,
+    OSError,
+    ValueError,
+    zipfile.BadZipFile,
+)
+
+
+class _FileTransaction:
+    """SQL statements delimiting one file's unit of work (T021).
+
+    Standalone (default): BEGIN / COMMIT / ROLLBACK per file. With a
+    savepoint name the file runs inside an outer multi-file transaction
+    (``files_per_transaction`` > 1): SAVEPOINT / RELEASE / ROLLBACK TO, so
+    per-file atomicity is kept while COMMIT round-trips are amortized.
+    """
+
+    __slots__ = ("begin_sql", "commit_sql", "rollback_sql")
+
+    def __init__(self, savepoint: str | None = None) -> None:
+        if savepoint is None:
+            self.begin_sql = "BEGIN"
+            self.commit_sql = "COMMIT"
+            self.rollback_sql = "ROLLBACK"
+        else:
+            self.begin_sql = f"SAVEPOINT {savepoint}"
+            self.commit_sql = f"RELEASE SAVEPOINT {savepoint}"
+            self.rollback_sql = f"ROLLBACK TO SAVEPOINT {savepoint}"
+
+
+_STANDALONE_TX = _FileTransaction()
+
+
+# ファイル単位エラーの sheet 欄 (row は常に -1)
+_FILE_LEVEL = "<FILE_LEVEL>"
+
+
+def _make_sheet_logger(
+    file_name: str, sheet_name: str, buf: ErrorLogBuffer
+) -> Callable[..., str]:
+    """Bind file/sheet names once and return an error-recording helper.
+
+    Returned ``log(error_type, exc, row=-1)`` appends an ErrorRecord to ``buf``
+    so exception handlers do not repeat the file/sheet/row arguments. It
+    returns the recorded message so handlers can reuse the same string
+    (e.g. for ``SheetProcess.error``) instead of formatting ``exc`` again.
+    """
+    def log(error_type: str, exc: BaseException, row: int = -1) -> str:
+        message = str(exc)
+        buf.append(ErrorRecord.create(file_name, sheet_name, row, error_type, message))
+        return message
+
+    return log
+
+
+# 先読み深さ: 読込中ワーカー分に加え、未消費の読込済ワークブックを最大この数だけ保持
+_PREFETCH_DEPTH = 2
+
+
+def _read_workbook(
+    path: Path, target_sheets: frozenset[str], read_opts: dict[str, Any]
+) -> dict[str, Any] | Exception:
+    """Prefetch worker: read one workbook, returning the exception on failure.
+
+    Module-level (not a closure) so it can be pickled for process workers.
+    """
+    try:
+        return read_excel_file(path, target_sheets=target_sheets, **read_opts)
+    except Exception as e:
+        return e
+
+
+def _prefetch_workbooks(
+    file_paths: Iterable[Path],
+    target_sheets: frozenset[str],
+    depth: int = _PREFETCH_DEPTH,
+    engine: str | None = None,
+    workers: int = 1,
+    use_processes: bool = False,
+) -> Iterator[tuple[Path, dict[str, Any] | Exception]]:
+    """Read workbooks on background workers and yield them in input order.
+
+    Excel parsing (CPU/disk) overlaps with the caller's DB inserts (network);
+    with ``workers`` > 1 several files are parsed concurrently. Threads share
+    the GIL, so pure-Python parsing (openpyxl) only scales across files with
+    ``use_processes``; parsed sheets are then pickled back to this process.
+    At most ``workers + depth`` files are submitted ahead of the consumer,
+    which bounds how many parsed workbooks are held in memory. Read failures
+    are yielded as the exception instance so the caller can handle them
+    inside its per-file transaction. ``engine`` is forwarded to
+    ``read_excel_file`` only when set.
+    """
+    read_opts: dict[str, Any] = {"engine": engine} if engine is not None else {}
+
+    paths = iter(file_paths)
+    pending: deque[tuple[Path, Future[dict[str, Any] | Exception]]] = deque()
+    pool: Executor
+    if use_processes:
+        pool = ProcessPoolExecutor(max_workers=max(1, workers))
+    else:
+        pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="excel-prefetch")
+
+    def _submit_next() -> None:
+        path = next(paths, None)
+        if path is not None:
+            pending.append((path, pool.submit(_read_workbook, path, target_sheets, read_opts)))
+
+    try:
+        for _ in range(max(1, workers) + depth):
+            _submit_next()
+        while pending:
+            path, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as e:
+                # プロセスワーカー異常終了・結果の pickle 失敗もファイル単位の読込失敗として扱う
+                result = e
+            _submit_next()
+            yield path, result
+    finally:
+        # 呼び出し側が途中終了した場合も未着手の読込を破棄してワーカーを解放する
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# 変換済みドメインマッピングの内容キー付きキャッシュ (設定再読込時の再変換を回避)
+_DOMAIN_MAPPINGS_CACHE: dict[str, Mapping[str, DomainSheetMappingConfig]] = {}
+_DOMAIN_MAPPINGS_CACHE_SIZE = 8
+
+
+def _domain_mappings_cache_key(config: ImportConfig) -> str | None:
+    """Content key for the domain mapping cache (None = not cacheable).
+
+    Keys are not sorted: sheet order drives the parent -> child insert order,
+    so configs that differ only in mapping order must not share an entry.
+    """
+    try:
+        sequences = getattr(config, "sequences", None)
+        return json.dumps(
+            [
+                list(config.sheet_mappings.items()),
+                getattr(config, "null_sentinels", None),
+                list(sequences.items()) if isinstance(sequences, dict) else None,
+            ],
+            default=repr,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _sheet_columns_data(
+    sheet_data: Any, columns: Sequence[str]
+) -> tuple[dict[str, list[Any]], int]:
+    """Return ``(column -> values, row_count)`` for ``columns`` of a sheet.
+
+    ``SheetData`` from ``normalize_sheet`` is already column-major, so this
+    only selects lists. Row-major inputs (``.rows`` dict list) are
+    transposed once; missing cells become None.
+    """
+    columns_data = getattr(sheet_data, "columns_data", None)
+    if isinstance(columns_data, dict):
+        row_count = sheet_data.row_count
+        return {c: columns_data.get(c) or [None] * row_count for c in columns}, row_count
+    rows = sheet_data.rows
+    return {c: [r.get(c) for r in rows] for c in columns}, len(rows)
+
+
+def _fill_fk_nulls(values: Sequence[Any], pk_values: Sequence[Any]) -> list[Any]:
+    """Return ``values`` with None cells replaced by ``pk_values[row % len]``.
+
+    適当な単一キー選択ロジック (データ行数==親件数かつ順序対応と仮定) を
+    NumPy の object 配列で一括適用する。``values`` 自体は変更しない。
+    """
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    missing = np.flatnonzero(np.fromiter((v is None for v in arr), dtype=bool, count=len(arr)))
+    if missing.size == 0 or not pk_values:
+        return list(values)
+    pk_arr = np.empty(len(pk_values), dtype=object)
+    pk_arr[:] = pk_values
+    arr[missing] = pk_arr[missing % len(pk_arr)]
+    return arr.tolist()
+
+
+def _index_fk_maps_by_child_column(
+    fk_maps: Iterable[FKPropagationMap],
+) -> dict[str, list[FKPropagationMap]]:
+    """Group FK maps by the last segment of ``child_fk_column`` (config order kept)."""
+    index: dict[str, list[FKPropagationMap]] = {}
+    for m in fk_maps:
+        index.setdefault(m.child_fk_column.rsplit(".", 1)[-1], []).append(m)
+    return index
+
+
+def _zip_insert_rows(
+    columns_data: Mapping[str, list[Any]], columns: Sequence[str], row_count: int
+) -> list[tuple[Any, ...]]:
+    """Zip column lists into insert row tuples (C-level transpose)."""
+    if not columns:
+        return [() for _ in range(row_count)]
+    return list(zip(*(columns_data[c] for c in columns), strict=True))
+
+
+def _convert_config_to_domain_mappings(
+    config: ImportConfig,
+) -> Mapping[str, DomainSheetMappingConfig]:
     """Convert basic config sheet mappings to domain model mappings.
     
+    Results are cached by mapping content, so a reloaded config with the
+    same sheet mappings reuses the already validated and converted objects.
+    
     Args:
         config: Basic ImportConfig from loader
         
     Returns:
-        Dictionary of sheet name to domain SheetMappingConfig
+        Read-only mapping of sheet name to domain SheetMappingConfig
+    """
+    key = _domain_mappings_cache_key(config)
+    if key is not None and (cached := _DOMAIN_MAPPINGS_CACHE.get(key)) is not None:
+        return cached
+    domain_mappings = _build_domain_mappings(config)
+    if key is not None:
+        if len(_DOMAIN_MAPPINGS_CACHE) >= _DOMAIN_MAPPINGS_CACHE_SIZE:
+            # 最古エントリを破棄 (dict は挿入順)
+            _DOMAIN_MAPPINGS_CACHE.pop(next(iter(_DOMAIN_MAPPINGS_CACHE)))
+        _DOMAIN_MAPPINGS_CACHE[key] = domain_mappings
+    return domain_mappings
+
+
+def _declared_pk_columns(sequences: Any) -> dict[str, str]:
+    """Map table -> PK column from ``"table.col"`` sequence keys (first wins).
+
+    列名のみのキーはどのテーブルの列か特定できないため対象外
+    (RETURNING * + cursor.description 推定に任せる)。
+    """
+    declared: dict[str, str] = {}
+    if not isinstance(sequences, dict):
+        return declared
+    for key in sequences:
+        if isinstance(key, str) and "." in key:
+            table, col = key.split(".", 1)
+            declared.setdefault(table, col)
+    return declared
+
+
+def _pk_candidates(sequences: Any, table_name: str) -> tuple[str, ...]:
+    """PK column candidates for ``table_name`` in sequences key order.
+
+    sequences の key は列名想定; 旧形式 ``table.col`` は当該テーブル分のみ採用。
+    """
+    if not isinstance(sequences, dict):
+        return ()
+    candidates: list[str] = []
+    for key in sequences:
+        if not isinstance(key, str):
+            continue
+        if "." in key:
+            table, col = key.split(".", 1)
+            if table == table_name:
+                candidates.append(col)
+        else:
+            candidates.append(key)
+    return tuple(candidates)
+
+
+def _build_domain_mappings(config: ImportConfig) -> Mapping[str, DomainSheetMappingConfig]:
+    """Validate and convert ``config.sheet_mappings`` (uncached).
+
+    Sheet names are interned so that lookups against the (also interned)
+    names from ``read_excel_file`` reuse the cached string hash. The result is
+    shared through the module cache, so every container in it is immutable
+    (frozensets, and a read-only copy of ``default_values``).
     """
     domain_mappings: dict[str, DomainSheetMappingConfig] = {}
     
-    global_nulls = set()
+    global_nulls: frozenset[str] = frozenset()
     # loader.ImportConfig may have list[str] or None
     try:
         if getattr(config, 'null_sentinels', None):
-            global_nulls = {s.strip().upper() for s in config.null_sentinels if isinstance(s, str)}  # type: ignore[attr-defined]
+            global_nulls = frozenset(
+                s.strip().upper()
+                for s in config.null_sentinels  # type: ignore[attr-defined]
+                if isinstance(s, str)
+            )
     except Exception:
-        global_nulls = set()
+        global_nulls = frozenset()
 
-    for sheet_name, mapping_data in config.sheet_mappings.items():
+    sequences = getattr(config, "sequences", None)
+    declared_pks = _declared_pk_columns(sequences)
+
+    for raw_sheet_name, mapping_data in config.sheet_mappings.items():
+        sheet_name = sys.intern(raw_sheet_name)
         if not isinstance(mapping_data, dict):
             raise ProcessingError(
                 f"Invalid mapping data for sheet '{sheet_name}': expected a dict, "
@@ -90,14 +455,17 @@ def _convert_config_to_domain_mappings(config: ImportConfig) -> dict[str, Domain
         table_name = mapping_data.get("table", sheet_name.lower())
         
         # Get sequence columns for this sheet from the mapping data
-        sequence_cols = set(mapping_data.get("sequence_columns", []))
+        sequence_cols = frozenset(mapping_data.get("sequence_columns", []))
         
         # Get FK propagation columns for this sheet from the mapping data
-        fk_cols = set(mapping_data.get("fk_propagation_columns", []))
-        default_vals = mapping_data.get("default_values") if isinstance(mapping_data, dict) else None
+        fk_cols = frozenset(mapping_data.get("fk_propagation_columns", []))
+        # config 側の dict と共有しないようコピーしてから読み取り専用にする
+        default_vals = mapping_data.get("default_values")
+        if isinstance(default_vals, dict):
+            default_vals = MappingProxyType(dict(default_vals))
         
         # Get blob columns for this sheet from the mapping data
-        blob_cols = set(mapping_data.get("blob_columns", []))
+        blob_cols = frozenset(mapping_data.get("blob_columns", []))
         
         domain_mappings[sheet_name] = DomainSheetMappingConfig(
             sheet_name=sheet_name,
@@ -107,14 +475,27 @@ def _convert_config_to_domain_mappings(config: ImportConfig) -> dict[str, Domain
             default_values=default_vals,
             null_sentinels=global_nulls if global_nulls else None,
             blob_columns=blob_cols if blob_cols else None,
+            returning_pk_column=declared_pks.get(table_name),
+            pk_candidates=_pk_candidates(sequences, table_name),
         )
     
-    return domain_mappings
+    return MappingProxyType(domain_mappings)
+
+
+def _check_source_directory(directory: Path) -> None:
+    if not directory.exists():
+        raise ProcessingError(f"Directory not found: {directory}")
+    
+    if not directory.is_dir():
+        raise ProcessingError(f"Path is not a directory: {directory}")
 
 
 def scan_excel_files(directory: Path) -> list[Path]:
     """Scan directory for .xlsx files (non-recursive).
     
+    The list is built in a single ``os.scandir`` pass; ``process_all`` needs
+    the file count up front for the progress total, so enumeration is not lazy.
+    
     Args:
         directory: Directory to scan for Excel files
         
@@ -124,14 +505,11 @@ def scan_excel_files(directory: Path) -> list[Path]:
     Raises:
         ProcessingError: If directory doesn't exist or can't be read
     """
-    if not directory.exists():
-        raise ProcessingError(f"Directory not found: {directory}")
-    
-    if not directory.is_dir():
-        raise ProcessingError(f"Path is not a directory: {directory}")
-    
+    _check_source_directory(directory)
+    # os.scandir: DirEntry が d_type をキャッシュするためファイル毎の stat を省略できる
     try:
-        return [p for p in directory.iterdir() if p.is_file() and p.suffix == ".xlsx"]
+        with os.scandir(directory) as entries:
+            return [Path(e.path) for e in entries if e.name.endswith(".xlsx") and e.is_file()]
     except OSError as e:
         raise ProcessingError(f"Error reading directory {directory}: {e}") from e
 
@@ -141,7 +519,8 @@ def process_all(config: ImportConfig, cursor: Any = None) -> ProcessingResult:
     
     This is the main orchestration function that:
     1. Scans the directory for .xlsx files
-    2. Processes each file in its own transaction
+    2. Processes each file in its own transaction (or savepoint, when
+       ``files_per_transaction`` groups several files per COMMIT)
     3. Aggregates metrics and results
     4. Returns ProcessingResult with summary data
     
@@ -155,7 +534,9 @@ def process_all(config: ImportConfig, cursor: Any = None) -> ProcessingResult:
     Raises:
         ProcessingError: For fatal errors that prevent processing
     """
+    # 壁時計は開始/終了の記録のみ; 経過時間は単調時計で計測 (時刻補正の影響を受けない)
     start_time = datetime.now(UTC)
+    start_ns = time.monotonic_ns()
     error_log = ErrorLogBuffer()
     
     # Convert config to domain models
@@ -164,18 +545,16 @@ def process_all(config: ImportConfig, cursor: Any = None) -> ProcessingResult:
     except Exception as e:
         raise ProcessingError(f"Invalid configuration: {e}") from e
     
-    # Scan directory for Excel files
+    # Scan directory for Excel files once; the filtered list also gives the progress total
+    # (directory scanning errors are fatal ProcessingError)
     directory = Path(config.source_directory)
-    try:
-        file_paths = scan_excel_files(directory)
-    except ProcessingError:
-        # Re-raise directory scanning errors as fatal
-        raise
+    file_paths = scan_excel_files(directory)
+    file_count = len(file_paths)
     
     # Handle empty directory case (FR-025)
-    if not file_paths:
+    if not file_count:
         end_time = datetime.now(UTC)
-        elapsed = (end_time - start_time).total_seconds()
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
         return ProcessingResult(
             success_files=0,
             failed_files=0,
@@ -188,39 +567,84 @@ def process_all(config: ImportConfig, cursor: Any = None) -> ProcessingResult:
             file_stats=[]
         )
     
-    # FK 伝播関連マップ (親テーブル → 親 RETURNING 結果 PK マップ)
+    # 診断用の列定義を全マップ対象テーブル分まとめて1クエリで取得 (診断有効時のみ)
+    if cursor is not None and _diagnostics_enabled(config):
+        clear_table_columns_cache()
+        _prewarm_table_columns(cursor, (m.table_name for m in domain_mappings.values()))
+
+    # FK 伝播関連マップ (親テーブル → 親 RETURNING 結果 PK タプル)
     fk_maps: list[FKPropagationMap] = build_fk_propagation_maps(config)
-    parent_pk_lookup: dict[str, dict[Any, Any]] = {}
+    fk_maps_by_child = _index_fk_maps_by_child_column(fk_maps)
+    # 親テーブル → 参照する子テーブル (needs_returning の静的部分を事前計算)
+    parent_child_tables = build_parent_child_tables(config)
+    parent_pk_lookup: dict[str, tuple[Any, ...]] = {}
 
     # 既に RETURNING 済テーブルセット (needs_returning 判定用)
     processed_tables: set[str] = set()
 
     # Process each file with progress tracking
-    file_stats: list[FileStat] = []
+    file_stats = FileStatsAccumulator()
     success_count = 0
     failed_count = 0
     total_rows = 0
     total_skipped_sheets = 0
     
+    # Excel 読込はバックグラウンドで先行させ、DB 挿入と重ねる
+    target_sheets = frozenset(domain_mappings)
+    try:
+        engine = resolve_engine(getattr(config, "excel_engine", None))
+    except ValueError as e:
+        raise ProcessingError(f"Invalid configuration: {e}") from e
+
+    # Excel 読込の並列数。DB 挿入は単一カーソル上で直列のまま
+    # (ファイル毎トランザクションと FK 伝播の親→子順序がそれを前提とするため)
+    read_workers = getattr(config, "read_workers", 1) or 1
+    read_in_processes = getattr(config, "read_executor", "thread") == "process"
+
+    # files_per_transaction > 1: N ファイルを1トランザクションにまとめ、各ファイルは SAVEPOINT
+    group_size = getattr(config, "files_per_transaction", 1) or 1
+    grouped = cursor is not None and group_size > 1
+    open_group: list[int] = []  # 未 COMMIT グループ内ファイルの file_stats 位置
+    
     # Initialize progress tracker for files (T030)
-    with ProgressTracker(len(file_paths), description="Processing files") as progress:
-        for file_path in file_paths:
+    with ProgressTracker(file_count, description="Processing files") as progress:
+        for file_index, (file_path, workbook) in enumerate(
+            _prefetch_workbooks(
+                file_paths,
+                target_sheets,
+                engine=engine,
+                workers=read_workers,
+                use_processes=read_in_processes,
+            )
+        ):
+            # Path.name は呼び出し毎に文字列分解するため1回だけ取得して使い回す
+            file_name = file_path.name
             # Start file processing
             progress.start_file(file_path)
             
-            file_start = datetime.now(UTC)
+            tx = _STANDALONE_TX
+            if grouped:
+                if not open_group:
+                    _begin_file_group(cursor, error_log, file_name)
+                tx = _FileTransaction(savepoint=f"file_{file_index}")
+            
+            file_start_ns = time.monotonic_ns()
             file_result = _process_single_file(
                 file_path,
+                file_name,
                 domain_mappings,
                 cursor,
                 error_log,
-                fk_maps,
+                fk_maps_by_child,
+                parent_child_tables,
                 parent_pk_lookup,
                 processed_tables,
                 config,
+                prefetched=workbook,
+                tx=tx,
+                show_sheet_progress=progress.enabled,
             )
-            file_end = datetime.now(UTC)
-            file_elapsed = (file_end - file_start).total_seconds()
+            file_elapsed = (time.monotonic_ns() - file_start_ns) / 1e9
             
             # Update counters
             if file_result.status == FileStatus.SUCCESS:
@@ -241,14 +665,30 @@ def process_all(config: ImportConfig, cursor: Any = None) -> ProcessingResult:
             # Finish file processing
             progress.finish_file(success=(file_result.status == FileStatus.SUCCESS))
             
-            # Create file stat
-            file_stat = FileStat(
-                file_name=file_path.name,
-                status=file_result.status.value,
-                inserted_rows=file_result.total_rows,
-                elapsed_seconds=file_elapsed
+            # Record file stat (FileStat objects are built once after the loop)
+            file_stats.add(
+                file_name,
+                file_result.status.value,
+                file_result.total_rows,
+                file_elapsed,
             )
-            file_stats.append(file_stat)
+            
+            if grouped:
+                open_group.append(len(file_stats) - 1)
+                if len(open_group) >= group_size:
+                    demoted = _commit_file_group(cursor, error_log, file_stats, open_group)
+                    success_count -= len(demoted)
+                    failed_count += len(demoted)
+                    total_rows -= sum(file_stats.inserted_rows[i] for i in demoted)
+                    open_group.clear()
+        
+        # 端数グループの COMMIT
+        if open_group:
+            demoted = _commit_file_group(cursor, error_log, file_stats, open_group)
+            success_count -= len(demoted)
+            failed_count += len(demoted)
+            total_rows -= sum(file_stats.inserted_rows[i] for i in demoted)
+            open_group.clear()
     
     # Flush error log once (R-005)
     try:
@@ -259,7 +699,7 @@ def process_all(config: ImportConfig, cursor: Any = None) -> ProcessingResult:
     
     # Calculate final metrics
     end_time = datetime.now(UTC)
-    elapsed_seconds = (end_time - start_time).total_seconds()
+    elapsed_seconds = (time.monotonic_ns() - start_ns) / 1e9
     
     # Calculate throughput (avoid division by zero)
     if elapsed_seconds > 0:
@@ -276,19 +716,71 @@ def process_all(config: ImportConfig, cursor: Any = None) -> ProcessingResult:
         end_time=end_time,
         elapsed_seconds=elapsed_seconds,
         throughput_rows_per_sec=throughput_rps,
-        file_stats=file_stats
+        file_stats=file_stats.to_file_stats()
     )
 
 
+def _begin_file_group(cursor: Any, error_log: ErrorLogBuffer, file_name: str) -> None:
+    """Open the outer transaction for a multi-file group.
+
+    A failure is recorded; the first file's SAVEPOINT will then fail too and
+    mark that file failed through the normal begin-error path.
+    """
+    try:
+        cursor.execute("BEGIN")
+    except Exception as e:
+        error_log.append(
+            ErrorRecord.create(file_name, _FILE_LEVEL, -1, "TRANSACTION_BEGIN_ERROR", str(e))
+        )
+
+
+def _commit_file_group(
+    cursor: Any,
+    error_log: ErrorLogBuffer,
+    file_stats: FileStatsAccumulator,
+    group: list[int],
+) -> list[int]:
+    """COMMIT a multi-file group; on failure demote its successful files.
+
+    Returns the ``file_stats`` positions switched from success to failed so
+    the caller can correct its counters.
+    """
+    try:
+        cursor.execute("COMMIT")
+        return []
+    except Exception as e:
+        try:
+            cursor.execute("ROLLBACK")
+        except Exception:
+            pass
+        success = FileStatus.SUCCESS.value
+        demoted = [i for i in group if file_stats.statuses[i] == success]
+        message = str(e)
+        for i in demoted:
+            file_stats.statuses[i] = FileStatus.FAILED.value
+        error_log.extend(
+            ErrorRecord.create(
+                file_stats.file_names[i], _FILE_LEVEL, -1, "TRANSACTION_COMMIT_ERROR", message
+            )
+            for i in demoted
+        )
+        return demoted
+
+
 def _process_single_file(
     file_path: Path,
-    sheet_mappings: dict[str, DomainSheetMappingConfig],
+    file_name: str,
+    sheet_mappings: Mapping[str, DomainSheetMappingConfig],
     cursor: Any,
     error_log: ErrorLogBuffer,
-    fk_maps: list[FKPropagationMap],
-    parent_pk_lookup: dict[str, dict[Any, Any]],
+    fk_maps_by_child: Mapping[str, list[FKPropagationMap]],
+    parent_child_tables: Mapping[str, frozenset[str]],
+    parent_pk_lookup: dict[str, tuple[Any, ...]],
     processed_tables: set[str],
     raw_config: ImportConfig,
+    prefetched: dict[str, Any] | Exception | None = None,
+    tx: _FileTransaction = _STANDALONE_TX,
+    show_sheet_progress: bool | None = None,
 ) -> ExcelFile:
     """Process a single Excel file with transaction boundary.
     
@@ -299,34 +791,34 @@ def _process_single_file(
     
     Args:
         file_path: Path to Excel file to process
+        file_name: ``file_path.name`` (resolved once by the caller)
         sheet_mappings: Sheet mapping configurations
         cursor: Database cursor (None = mock mode)  
         error_log: Error log buffer for recording errors
+        prefetched: Sheets already read by ``_prefetch_workbooks`` (or the
+            read exception); None reads the file here
+        tx: Transaction statements for this file (per-file or savepoint)
+        show_sheet_progress: Run-level TTY decision for sheet progress output
+            (None = detect per file)
         
     Returns:
         ExcelFile with processing results and status
     """
     start_time = datetime.now(UTC)
+    log = _make_sheet_logger(file_name, _FILE_LEVEL, error_log)
     
     # Begin transaction for this file (if real DB connection)
     if cursor is not None:
         try:
-            cursor.execute("BEGIN")
+            cursor.execute(tx.begin_sql)
         except Exception as e:
             # If we can't even begin a transaction, record error and fail
-            error_record = ErrorRecord.create(
-                file=file_path.name,
-                sheet="<FILE_LEVEL>",
-                row=-1,
-                error_type="TRANSACTION_BEGIN_ERROR",
-                db_message=str(e)
-            )
-            error_log.append(error_record)
+            log("TRANSACTION_BEGIN_ERROR", e)
             
             end_time = datetime.now(UTC)
             return ExcelFile(
                 path=file_path,
-                name=file_path.name,
+                name=file_name,
                 sheets=[],
                 start_time=start_time,
                 end_time=end_time,
@@ -337,26 +829,34 @@ def _process_single_file(
             )
     
     try:
-        # Read Excel file
-        raw_sheets = read_excel_file(file_path, target_sheets=set(sheet_mappings.keys()))
+        # Read Excel file (unless already read ahead)
+        if prefetched is None:
+            # dict のキービューは O(1) の in 判定が可能なので set を作り直さない
+            raw_sheets = read_excel_file(file_path, target_sheets=sheet_mappings.keys())
+        elif isinstance(prefetched, Exception):
+            raise prefetched
+        else:
+            raw_sheets = prefetched
 
         total_inserted_rows = 0
         skipped_sheets = 0
         sheet_processes: list[SheetProcess] = []
         file_failed = False
 
-        # Count sheets (config順) that both have a mapping and exist in workbook
-        mapped_sheets = [name for name in sheet_mappings.keys() if name in raw_sheets]
+        # Count sheets that both have a mapping and exist in workbook (件数のみ; リスト不要)
+        mapped_sheet_count = sum(name in raw_sheets for name in sheet_mappings)
 
         # Initialize sheet progress indicator (T030)
         sheet_progress = SheetProgressIndicator(
-            file_name=file_path.name,
-            total_sheets=len(mapped_sheets)
+            file_name=file_name,
+            total_sheets=mapped_sheet_count,
+            enabled=show_sheet_progress,
         )
         
         # Process in config (dict insertion) order
         for sheet_name, sheet_mapping in sheet_mappings.items():
-            # 物理シートに存在しない場合はスキップ (mapped_sheets 集計対象外なので skipped_sheets++)
+            # 物理シートに存在しない場合はスキップ
+            # (mapped_sheet_count 集計対象外なので skipped_sheets++)
             if sheet_name not in raw_sheets:
                 skipped_sheets += 1
                 continue
@@ -369,8 +869,9 @@ def _process_single_file(
                 sheet_mapping,
                 cursor,
                 error_log,
-                file_path.name,
-                fk_maps,
+                file_name,
+                fk_maps_by_child,
+                parent_child_tables,
                 parent_pk_lookup,
                 processed_tables,
                 raw_config,
@@ -384,7 +885,7 @@ def _process_single_file(
                 # Rollback immediately for file-level atomicity
                 if cursor is not None:
                     try:
-                        cursor.execute("ROLLBACK")
+                        cursor.execute(tx.rollback_sql)
                     except Exception:
                         pass
                 # Finish sheet (failed) and break out
@@ -403,7 +904,7 @@ def _process_single_file(
             end_time = datetime.now(UTC)
             return ExcelFile(
                 path=file_path,
-                name=file_path.name,
+                name=file_name,
                 sheets=sheet_processes,
                 start_time=start_time,
                 end_time=end_time,
@@ -416,25 +917,18 @@ def _process_single_file(
         # Commit transaction on success (if real DB connection)
         if cursor is not None:
             try:
-                cursor.execute("COMMIT")
+                cursor.execute(tx.commit_sql)
             except Exception as e:
                 # Treat commit failure as file failure
                 try:
-                    cursor.execute("ROLLBACK")
+                    cursor.execute(tx.rollback_sql)
                 except Exception:
                     pass
                 end_time = datetime.now(UTC)
-                error_record = ErrorRecord.create(
-                    file=file_path.name,
-                    sheet="<FILE_LEVEL>",
-                    row=-1,
-                    error_type="TRANSACTION_COMMIT_ERROR",
-                    db_message=str(e)
-                )
-                error_log.append(error_record)
+                log("TRANSACTION_COMMIT_ERROR", e)
                 return ExcelFile(
                     path=file_path,
-                    name=file_path.name,
+                    name=file_name,
                     sheets=sheet_processes,
                     start_time=start_time,
                     end_time=end_time,
@@ -449,7 +943,7 @@ def _process_single_file(
         # Return successful result
         return ExcelFile(
             path=file_path,
-            name=file_path.name,
+            name=file_name,
             sheets=sheet_processes,
             start_time=start_time,
             end_time=end_time,
@@ -460,44 +954,36 @@ def _process_single_file(
         )
         
     except Exception as e:
+        # 想定外の例外種別は異常系として明示 (想定内は ERROR ログのみで次ファイルへ)
+        if not isinstance(e, _EXPECTED_FILE_ERRORS):
+            logger.critical(
+                "unexpected %s while processing file=%s", type(e).__name__, file_name,
+                exc_info=True,
+            )
         # Rollback transaction on any failure (if real DB connection)
         if cursor is not None:
             try:
-                cursor.execute("ROLLBACK")
+                cursor.execute(tx.rollback_sql)
             except Exception as rollback_e:
                 # Log rollback failure but don't override original error
-                rollback_error = ErrorRecord.create(
-                    file=file_path.name,
-                    sheet="<FILE_LEVEL>",
-                    row=-1,
-                    error_type="TRANSACTION_ROLLBACK_ERROR",
-                    db_message=str(rollback_e)
-                )
-                error_log.append(rollback_error)
+                log("TRANSACTION_ROLLBACK_ERROR", rollback_e)
         
         # Log file-level error
-        error_record = ErrorRecord.create(
-            file=file_path.name,
-            sheet="<FILE_LEVEL>",
-            row=-1,
-            error_type="PROCESSING_ERROR",
-            db_message=str(e)
-        )
-        error_log.append(error_record)
+        message = log("PROCESSING_ERROR", e)
         
         end_time = datetime.now(UTC)
         
         # Return failed result
         return ExcelFile(
             path=file_path,
-            name=file_path.name,
+            name=file_name,
             sheets=[],
             start_time=start_time,
             end_time=end_time,
             status=FileStatus.FAILED,
             total_rows=0,
             skipped_sheets=0,
-            error=str(e)
+            error=message
         )
 
 
@@ -508,8 +994,9 @@ def _process_single_sheet(
     cursor: Any,
     error_log: ErrorLogBuffer,
     file_name: str,
-    fk_maps: list[FKPropagationMap],
-    parent_pk_lookup: dict[str, dict[Any, Any]],
+    fk_maps_by_child: Mapping[str, list[FKPropagationMap]],
+    parent_child_tables: Mapping[str, frozenset[str]],
+    parent_pk_lookup: dict[str, tuple[Any, ...]],
     processed_tables: set[str],
     raw_config: ImportConfig,
 ) -> SheetProcess:
@@ -526,6 +1013,7 @@ def _process_single_sheet(
     Returns:
         SheetProcess with processing results
     """
+    log = _make_sheet_logger(file_name, sheet_name, error_log)
     try:
         # Normalize sheet data (extract header from row 2, data from row 3+)
         try:
@@ -544,22 +1032,22 @@ def _process_single_sheet(
                 default_values=sheet_mapping.default_values,
             )  # pragma: no cover (fallback path for legacy mocks)
         
-        if not sheet_data.rows:
+        # Prepare data for batch insert: sequence列は除外、FK伝播列は含めて後で値補完
+        ignored_columns = sheet_mapping.sequence_columns
+        insert_columns = [col for col in sheet_data.columns if col not in ignored_columns]
+        columns_data, row_count = _sheet_columns_data(sheet_data, insert_columns)
+
+        if row_count == 0:
             # Empty sheet, but not an error
             return SheetProcess(
                 sheet_name=sheet_name,
                 table_name=sheet_mapping.table_name,
                 mapping=sheet_mapping,
                 rows=None,
-                ignored_columns=(
-                    sheet_mapping.sequence_columns | sheet_mapping.fk_propagation_columns
-                ),
+                ignored_columns=sheet_mapping.ignored_columns,
                 inserted_rows=0,
                 error=None
             )
-        # Prepare data for batch insert: sequence列は除外、FK伝播列は含めて後で値補完
-        ignored_columns = sheet_mapping.sequence_columns
-        insert_columns = [col for col in sheet_data.columns if col not in ignored_columns]
         table_name = sheet_mapping.table_name
 
         # Warn if nothing to insert (all columns were ignored)
@@ -572,80 +1060,84 @@ def _process_single_sheet(
             )
 
         # Determine if this table is a parent requiring RETURNING
-        do_returning = False
-        if cursor is not None:
-            try:
-                do_returning = needs_returning(table_name, raw_config, processed_tables)
-            except Exception:
-                do_returning = False
+        # (needs_returning と同判定: 未処理の子テーブルが残る親のみ)
+        child_tables = parent_child_tables.get(table_name)
+        do_returning = (
+            cursor is not None
+            and child_tables is not None
+            and not child_tables <= processed_tables
+        )
+        pk_column = sheet_mapping.returning_pk_column
         
-        # Build raw insert rows
-        insert_rows = []
-        for row_dict in sheet_data.rows:
-            row_values = [row_dict.get(col) for col in insert_columns]
-            insert_rows.append(row_values)
         logger.debug(
             "sheet=%s table=%s insert_columns=%s row_count=%d fk_cols=%s returning_candidate=%s",
             sheet_name,
             table_name,
             insert_columns,
-            len(insert_rows),
+            row_count,
             sorted(sheet_mapping.fk_propagation_columns),
             do_returning,
         )
-        # Print trace for direct visibility regardless of logger level (temporary diagnostic)
-        try:
-            print(
-                f"[TRACE] build sheet={sheet_name} table={table_name} cols={len(insert_columns)} rows={len(insert_rows)} returning={do_returning} first_row={insert_rows[0] if insert_rows else '[]'}"
-            )
-        except Exception:  # pragma: no cover
-            pass
 
         # FK 伝播適用: 親マップが存在し、当該シートに fk_propagation_columns がある場合
         if sheet_mapping.fk_propagation_columns and cursor is not None:
             # 簡易: 全ての fk_propagation_columns について parent_pk_lookup のどれか1つを利用
             # マッピング形式 parent_table.parent_identifier -> child_table.child_fk
             for fk_col in sheet_mapping.fk_propagation_columns:
-                if fk_col not in insert_columns:
-                    continue  # sequence によって除外されたなど
-                # 探索: fk_maps から該当 child_fk_column 終端一致
-                target_maps = [m for m in fk_maps if m.child_fk_column.endswith(f".{fk_col}") or m.child_fk_column == fk_col]
+                if fk_col not in columns_data:
+                    # sequence によって除外されたなど (columns_data は insert 列で索引済み)
+                    continue
+                # 探索: child_fk_column 終端 (列名) で索引済み
+                target_maps = fk_maps_by_child.get(fk_col)
                 if not target_maps:
                     logger.warning("FK propagation mapping not found for fk_col=%s sheet=%s", fk_col, sheet_name)
                     continue
                 # 1件のみ利用 (複数は未サポート)
                 m = target_maps[0]
-                parent_map = parent_pk_lookup.get(m.parent_table)
-                if not parent_map:
+                parent_pks = parent_pk_lookup.get(m.parent_table)
+                if not parent_pks:
                     logger.warning("Parent PK map not ready for parent_table=%s fk_col=%s", m.parent_table, fk_col)
                     continue
                 # 値置換: 現状 row_dict 内に識別子キー列が同一 fk_col 名で入っているとは限らない -> 単純に None のセル埋めのみ
-                col_index = insert_columns.index(fk_col)
-                for ridx, row_values in enumerate(insert_rows):
-                    if row_values[col_index] is None:
-                        # 適当な単一キー選択ロジック (データ行数==親件数かつ順序対応と仮定)
-                        # 安全のためインデックスで対応
-                        try:
-                            pk_list = list(parent_map.values())
-                            row_values[col_index] = pk_list[ridx % len(pk_list)] if pk_list else None
-                        except Exception:  # pragma: no cover
-                            pass
+                # 列指向: FK 列のみ新しいリストとして補完 (sheet_data 側は不変)
+                columns_data[fk_col] = _fill_fk_nulls(columns_data[fk_col], parent_pks)
+
+        # Build insert rows from column lists (行 dict を経由しない)
+        insert_rows = _zip_insert_rows(columns_data, insert_columns, row_count)
         
         # Perform batch insert
         if cursor is not None:
             # Real database insert
             # Pre-insert diagnostic: compare insert columns to table definition
-            _diagnose_table_columns(cursor, sheet_mapping.table_name, insert_columns)
-            result = batch_insert(
-                cursor=cursor,
-                table=sheet_mapping.table_name,
-                columns=insert_columns,
-                rows=insert_rows,
-                returning=do_returning,
-                page_size=1000,  # R-006 default batch size
-                blob_columns=sheet_mapping.blob_columns,
-                source_directory=raw_config.source_directory,
-            )
+            if _diagnostics_enabled(raw_config):
+                _diagnose_table_columns(cursor, sheet_mapping.table_name, insert_columns)
+            copy_threshold = _copy_threshold(raw_config)
+            if not do_returning and copy_threshold and len(insert_rows) >= copy_threshold:
+                # 親 PK 不要な大量行は COPY (R-010)
+                result = copy_insert(
+                    cursor=cursor,
+                    table=sheet_mapping.table_name,
+                    columns=insert_columns,
+                    rows=insert_rows,
+                    blob_columns=sheet_mapping.blob_columns,
+                    source_directory=raw_config.source_directory,
+                )
+            else:
+                insert_opts: dict[str, Any] = {}
+                if do_returning and pk_column:
+                    # PK 列既知: RETURNING "pk" のみ (戻り値タプルの0番目)
+                    insert_opts["returning_columns"] = [pk_column]
+                result = batch_insert(
+                    cursor=cursor,
+                    table=sheet_mapping.table_name,
+                    columns=insert_columns,
+                    rows=insert_rows,
+                    returning=do_returning,
+                    page_size=_page_size(raw_config),
+                    blob_columns=sheet_mapping.blob_columns,
+                    source_directory=raw_config.source_directory,
+                    **insert_opts,
+                )
             inserted_rows = result.inserted_rows
             logger.debug(
                 "sheet=%s executed batch_insert inserted_rows=%d returning=%s returned_values_len=%s",
@@ -654,51 +1146,42 @@ def _process_single_sheet(
                 do_returning,
                 (len(result.returned_values) if result.returned_values else 0),
             )
-            try:
-                print(
-                    f"[TRACE] inserted sheet={sheet_name} inserted_rows={inserted_rows} returned={len(result.returned_values) if result.returned_values else 0}"
-                )
-            except Exception:  # pragma: no cover
-                pass
             # Build parent PK map if needed
             if do_returning and result.returned_values:
-                # 推定: sequences で親 PK 列名を推理 (列名→シーケンスの辞書なので key を列名扱い)
-                # もし複数候補なら最初を使用 (複数 PK 未対応)
-                candidate_pk_cols: list[str] = []
-                for col in raw_config.sequences.keys():
-                    # sequences の key は列名想定
-                    if "." in col:
-                        # 旧形式で table.col の場合、現在テーブル名に一致するものを抽出
-                        t, c = col.split(".", 1)
-                        if t == table_name:
-                            candidate_pk_cols.append(c)
-                    else:
-                        candidate_pk_cols.append(col)
-
-                pk_col_index = 0  # fallback
-                detected = False
-                try:
-                    # psycopg2 の cursor.description から列順メタデータを取得し、候補列一致を探索
-                    if cursor is not None and getattr(cursor, "description", None):  # type: ignore[truthy-bool]
-                        col_names = [d[0] for d in cursor.description]  # type: ignore[index]
-                        for cand in candidate_pk_cols:
-                            if cand in col_names:
-                                pk_col_index = col_names.index(cand)
-                                detected = True
-                                break
-                except Exception:  # pragma: no cover
-                    logger.debug("could not inspect cursor.description for pk index", exc_info=True)
-
-                if not detected and candidate_pk_cols:
-                    # 候補はあるが description 無い場合は 0 のまま (戻り値位置依存)
-                    logger.debug(
-                        "pk column index fallback=0 table=%s candidates=%s", table_name, candidate_pk_cols
-                    )
+                if pk_column:
+                    pk_col_index = 0  # RETURNING "pk" で列順確定済み
+                else:
+                    # 推定: sequences 由来の候補 (マッピング変換時に算出済み) から親 PK 列を探索
+                    # もし複数候補なら最初を使用 (複数 PK 未対応)
+                    candidate_pk_cols = sheet_mapping.pk_candidates
+
+                    pk_col_index = 0  # fallback
+                    detected = False
+                    try:
+                        # psycopg2 の cursor.description から列順メタデータを取得し、候補列一致を探索
+                        if cursor is not None and getattr(cursor, "description", None):  # type: ignore[truthy-bool]
+                            col_names = [d[0] for d in cursor.description]  # type: ignore[index]
+                            for cand in candidate_pk_cols:
+                                if cand in col_names:
+                                    pk_col_index = col_names.index(cand)
+                                    detected = True
+                                    break
+                    except Exception:  # pragma: no cover
+                        logger.debug("could not inspect cursor.description for pk index", exc_info=True)
+
+                    if not detected and candidate_pk_cols:
+                        # 候補はあるが description 無い場合は 0 のまま (戻り値位置依存)
+                        logger.debug(
+                            "pk column index fallback=0 table=%s candidates=%s", table_name, candidate_pk_cols
+                        )
 
-                # PK 値抽出 (rv[pk_col_index]) をキー・値ともに利用（現行ロジック互換: values() 列挙で順序使用）
-                parent_pk_lookup[table_name] = {
-                    rv[pk_col_index]: rv[pk_col_index] for rv in result.returned_values if rv and len(rv) > pk_col_index
-                }
+                # PK 値抽出 (rv[pk_col_index]) を RETURNING 順のタプルで保持
+                # (子シートはそのまま参照)
+                parent_pk_lookup[table_name] = tuple(
+                    rv[pk_col_index]
+                    for rv in result.returned_values
+                    if rv and len(rv) > pk_col_index
+                )
                 processed_tables.add(table_name)
                 logger.debug(
                     "sheet=%s parent_pk_map_size=%d",
@@ -713,10 +1196,6 @@ def _process_single_sheet(
                 sheet_name,
                 inserted_rows,
             )
-            try:
-                print(f"[TRACE] mock-insert sheet={sheet_name} inserted_rows={inserted_rows}")
-            except Exception:  # pragma: no cover
-                pass
 
         # 子テーブルなら、既に親 PK マップがある場合に本来は FK 列を埋めて再挿入すべきだが
         # 現行アーキテクチャでは除外列をそもそも挿入しない形のため、将来: 挿入前に
@@ -726,10 +1205,7 @@ def _process_single_sheet(
             # ここまでで do_returning=False は「子側想定」。既に親 PK マップ構築済みなら補完後に挿入されている。
             # 先行ループで None 埋め補完を試行済みなのでここでは診断ログのみ残す。
             for fk_col in sheet_mapping.fk_propagation_columns:
-                mapped = any(
-                    m.child_fk_column.endswith(f".{fk_col}") or m.child_fk_column == fk_col for m in fk_maps
-                )
-                if mapped:
+                if fk_col in fk_maps_by_child:
                     logger.debug(
                         "sheet=%s fk_col=%s fk_propagation_applied_or_no_nulls", sheet_name, fk_col
                     )
@@ -749,15 +1225,8 @@ def _process_single_sheet(
         )
     
     except (SheetHeaderError, MissingColumnsError) as e:
-        # Sheet validation errors
-        error_record = ErrorRecord.create(
-            file=file_name,
-            sheet=sheet_name,
-            row=-1,  # Sheet-level error
-            error_type="SHEET_VALIDATION_ERROR",
-            db_message=str(e)
-        )
-        error_log.append(error_record)
+        # Sheet validation errors (row=-1: sheet-level error)
+        message = log("SHEET_VALIDATION_ERROR", e)
         
         return SheetProcess(
             sheet_name=sheet_name,
@@ -766,20 +1235,16 @@ def _process_single_sheet(
             rows=None,
             ignored_columns=set(),
             inserted_rows=0,
-            error=str(e)
+            error=message
         )
         
     except BatchInsertError as e:
         # Database insert errors
-        print(f"[TRACE] batch_insert error sheet={sheet_name} table={sheet_mapping.table_name}: {e}")
-        error_record = ErrorRecord.create(
-            file=file_name,
-            sheet=sheet_name,
-            row=-1,  # Batch-level error (could be refined to specific row later)
-            error_type="DATABASE_INSERT_ERROR",
-            db_message=str(e)
+        logger.debug(
+            "batch_insert error sheet=%s table=%s: %s", sheet_name, sheet_mapping.table_name, e
         )
-        error_log.append(error_record)
+        # Batch-level error (row could be refined to specific row later)
+        message = log("DATABASE_INSERT_ERROR", e)
         
         return SheetProcess(
             sheet_name=sheet_name,
@@ -788,19 +1253,12 @@ def _process_single_sheet(
             rows=None,
             ignored_columns=set(),
             inserted_rows=0,
-            error=str(e)
+            error=message
         )
         
     except Exception as e:
         # Unexpected errors
-        error_record = ErrorRecord.create(
-            file=file_name,
-            sheet=sheet_name,
-            row=-1,
-            error_type="UNEXPECTED_ERROR",
-            db_message=str(e)
-        )
-        error_log.append(error_record)
+        message = log("UNEXPECTED_ERROR", e)
         
         return SheetProcess(
             sheet_name=sheet_name,
@@ -809,5 +1267,5 @@ def _process_single_sheet(
             rows=None,
             ignored_columns=set(),
             inserted_rows=0,
-            error=str(e)
+            error=message
         )
\ No newline at end of file
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import os
 import sys
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from tqdm import tqdm
-from tqdm.std import tqdm as TqdmType
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tqdm.std import tqdm as TqdmType
 
 """Progress display service with tqdm (TTY only).
 
@@ -28,12 +30,32 @@ __all__ = [
 ]
 
 
+# 進行表示の再描画間隔 (QR-008: 1秒以内)
+_REFRESH_INTERVAL_SEC = 1.0
+
+# tqdm クラス。TTY 有効時に _load_tqdm() が初回 import する (非 TTY 実行では import しない)
+tqdm: Any = None
+
+
+def _load_tqdm() -> Any:
+    """Import tqdm on first use and return the ``tqdm`` class."""
+    global tqdm
+    if tqdm is None:
+        from tqdm import tqdm as tqdm_cls
+        tqdm = tqdm_cls
+    return tqdm
+
+
 def is_tty_enabled() -> bool:
     """Check if TTY output is enabled.
     
+    ``TQDM_DISABLE`` (tqdm 標準の環境変数) が真値なら TTY でも無効。
+    
     Returns:
         True if stdout is a TTY and progress should be displayed, False otherwise
     """
+    if os.environ.get("TQDM_DISABLE", "").strip().lower() not in ("", "0", "false"):
+        return False
     return sys.stdout.isatty()
 
 
@@ -45,6 +67,8 @@ class ProgressTracker:
     ANSI control sequence spam.
     """
     
+    __slots__ = ("total_files", "description", "current_file", "enabled", "pbar")
+    
     def __init__(self, total_files: int, *, description: str = "Processing files") -> None:
         """Initialize progress tracker.
         
@@ -60,7 +84,7 @@ class ProgressTracker:
         self.enabled = is_tty_enabled()
         self.pbar: TqdmType[Any] | None
         if self.enabled:
-            self.pbar = tqdm(
+            self.pbar = _load_tqdm()(
                 total=total_files,
                 desc=description,
                 unit="file",
@@ -69,6 +93,7 @@ class ProgressTracker:
                 position=0,
                 ncols=80,  # Standard width for consistency
                 ascii=True,  # ASCII chars for better compatibility
+                mininterval=_REFRESH_INTERVAL_SEC,
             )
         else:
             self.pbar = None
@@ -82,9 +107,9 @@ class ProgressTracker:
         self.current_file += 1
         
         if self.enabled and self.pbar is not None:
-            # Update description to show current file
+            # Update description to show current file (再描画は update() 側に任せる)
             file_desc = f"{self.description} ({file_path.name})"
-            self.pbar.set_description(file_desc)
+            self.pbar.set_description(file_desc, refresh=False)
     
     def finish_file(self, success: bool = True) -> None:
         """Finish processing a file.
@@ -93,10 +118,8 @@ class ProgressTracker:
             success: Whether the file was processed successfully
         """
         if self.enabled and self.pbar is not None:
+            # mininterval 経過時のみ再描画 (QR-008)。description は次の start_file で上書き
             self.pbar.update(1)
-            
-            # Reset description to base description
-            self.pbar.set_description(self.description)
     
     def set_postfix(self, **kwargs: Any) -> None:
         """Set postfix information (stats) on the progress bar.
@@ -105,11 +128,13 @@ class ProgressTracker:
             **kwargs: Key-value pairs to show as postfix
         """
         if self.enabled and self.pbar is not None:
-            self.pbar.set_postfix(**kwargs)
+            self.pbar.set_postfix(refresh=False, **kwargs)
     
     def close(self) -> None:
         """Close the progress bar."""
         if self.enabled and self.pbar is not None:
+            # Reset description to base description for the final line
+            self.pbar.set_description(self.description, refresh=False)
             self.pbar.close()
             self.pbar = None
     
@@ -130,17 +155,23 @@ class SheetProgressIndicator:
     detailed progress tracking.
     """
     
-    def __init__(self, file_name: str, total_sheets: int) -> None:
+    __slots__ = ("file_name", "total_sheets", "current_sheet", "enabled", "_pending_line")
+    
+    def __init__(self, file_name: str, total_sheets: int, enabled: bool | None = None) -> None:
         """Initialize sheet progress indicator.
         
         Args:
             file_name: Name of the file being processed
             total_sheets: Total number of sheets in the file
+            enabled: TTY decision already made by the caller (e.g. the run's
+                ``ProgressTracker.enabled``); None checks the TTY here
         """
         self.file_name = file_name
         self.total_sheets = total_sheets
         self.current_sheet = 0
-        self.enabled = is_tty_enabled()
+        self.enabled = is_tty_enabled() if enabled is None else enabled
+        # start_sheet の表示は finish_sheet で結果と合わせて1回で書き出す
+        self._pending_line = ""
     
     def start_sheet(self, sheet_name: str) -> None:
         """Start processing a sheet.
@@ -151,9 +182,8 @@ class SheetProgressIndicator:
         self.current_sheet += 1
         
         if self.enabled:
-            # Simple print for sheet progress (not persistent like tqdm)
-            progress_str = f"  Sheet {self.current_sheet}/{self.total_sheets}: {sheet_name}"
-            print(progress_str, end="", flush=True)
+            # Simple line for sheet progress (not persistent like tqdm)
+            self._pending_line = f"  Sheet {self.current_sheet}/{self.total_sheets}: {sheet_name}"
     
     def finish_sheet(self, success: bool = True, rows_processed: int = 0) -> None:
         """Finish processing a sheet.
@@ -165,6 +195,9 @@ class SheetProgressIndicator:
         if self.enabled:
             status = "✓" if success else "✗"
             if rows_processed > 0:
-                print(f" - {rows_processed} rows {status}")
+                result_str = f" - {rows_processed} rows {status}"
             else:
-                print(f" {status}")
\ No newline at end of file
+                result_str = f" {status}"
+            sys.stdout.write(f"{self._pending_line}{result_str}\n")
+            sys.stdout.flush()
+            self._pending_line = ""
\ No newline at end of file
@@ -12,6 +12,53 @@ Task: T026 - Implement metrics accumulation & SUMMARY line rendering
 """
 
 
+# contracts/summary_output.md の SUMMARY 行の本体 ({0} は files の分子・分母で共用)。
+# "SUMMARY " 接頭辞は render_summary_line / SUMMARY ログレベルのフォーマッタ側で付与
+_SUMMARY_FIELDS_TEMPLATE = (
+    "files={0}/{0} success={1} failed={2} rows={3} "
+    "skipped_sheets={4} elapsed_sec={5} throughput_rps={6}"
+)
+
+
+def _format_number(value: float) -> str:
+    """Format a metric for the SUMMARY line without scientific notation.
+    
+    Integral values drop the decimal point ("2.0" -> "2"); values below 0.01
+    are written in fixed notation ("5e-05" -> "0.00005").
+    """
+    if not value:
+        return "0"
+    integral = int(value)
+    if integral == value:
+        return str(integral)
+    if value < 0.01:
+        return f"{value:.6f}".rstrip('0').rstrip('.')
+    return repr(value)
+
+
+def render_summary_fields(total_files: int, result: ProcessingResult) -> str:
+    """Render the SUMMARY line body (everything after ``"SUMMARY "``).
+    
+    Used with ``log_summary``, whose formatter adds the ``SUMMARY`` label.
+    
+    Args:
+        total_files: Total number of files detected/processed
+        result: ProcessingResult containing aggregated metrics
+        
+    Returns:
+        ``files=... throughput_rps=...`` field string
+    """
+    return _SUMMARY_FIELDS_TEMPLATE.format(
+        total_files,
+        result.success_files,
+        result.failed_files,
+        result.total_inserted_rows,
+        result.skipped_sheets,
+        _format_number(result.elapsed_seconds),
+        _format_number(result.throughput_rows_per_sec),
+    )
+
+
 def render_summary_line(total_files: int, result: ProcessingResult) -> str:
     """Render a SUMMARY line from ProcessingResult according to contract format.
     
@@ -38,31 +85,4 @@ def render_summary_line(total_files: int, result: ProcessingResult) -> str:
         >>> render_summary_line(1, result)  # doctest: +ELLIPSIS
         'SUMMARY files=1/1 success=1 failed=0 rows=1000 skipped_sheets=0 elapsed_sec=2 ...'
     """
-    # Format elapsed_sec and throughput_rps according to contract
-    # Handle very small numbers and integer values appropriately
-    if result.elapsed_seconds == 0:
-        elapsed_str = "0"
-    elif result.elapsed_seconds == int(result.elapsed_seconds):
-        elapsed_str = str(int(result.elapsed_seconds))
-    elif result.elapsed_seconds < 0.01:
-        # Format very small numbers to avoid scientific notation
-        elapsed_str = f"{result.elapsed_seconds:.6f}".rstrip('0').rstrip('.')
-    else:
-        elapsed_str = str(result.elapsed_seconds)
-    
-    if result.throughput_rows_per_sec == 0:
-        throughput_str = "0"
-    elif result.throughput_rows_per_sec == int(result.throughput_rows_per_sec):
-        throughput_str = str(int(result.throughput_rows_per_sec))
-    else:
-        throughput_str = str(result.throughput_rows_per_sec)
-    
-    return (
-        f"SUMMARY files={total_files}/{total_files} "
-        f"success={result.success_files} "
-        f"failed={result.failed_files} "
-        f"rows={result.total_inserted_rows} "
-        f"skipped_sheets={result.skipped_sheets} "
-        f"elapsed_sec={elapsed_str} "
-        f"throughput_rps={throughput_str}"
-    )
\ No newline at end of file
+    return f"SUMMARY {render_summary_fields(total_files, result)}"
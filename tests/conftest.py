@@ -1,21 +1,43 @@
 # Shared pytest fixtures (Phase 1 scaffolding)
 from __future__ import annotations
 
-import tempfile
+import hashlib
+import json
+import os
+import re
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+CONTRACTS_DIR = (
+    Path(__file__).resolve().parents[1] / "specs" / "001-excel-postgressql-excel" / "contracts"
+)
+
+# contracts/summary_output.md の SUMMARY 行正規表現 (実装側とは独立に保持する契約)
+SUMMARY_LINE_REGEX = (
+    r"^SUMMARY\s+files=([0-9]+)/(\1)\s+success=([0-9]+)\s+failed=([0-9]+)\s+"
+    r"rows=([0-9]+)\s+skipped_sheets=([0-9]+)\s+elapsed_sec=([0-9]+\.?[0-9]*)\s+"
+    r"throughput_rps=([0-9]+\.?[0-9]*)$"
+)
+
+
+def _compiled_schema_validator(schema_file: str):
+    """Load a contract schema once and build its validator (draft from ``$schema``)."""
+    jsonschema = pytest.importorskip("jsonschema")
+    schema = json.loads((CONTRACTS_DIR / schema_file).read_text(encoding="utf-8"))
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
 
 @pytest.fixture()
-def temp_workdir(monkeypatch) -> Path:
-    with tempfile.TemporaryDirectory() as d:
-        p = Path(d)
-        (p / "config").mkdir()
-        (p / "data").mkdir()
-        (p / "logs").mkdir()
-        monkeypatch.chdir(p)
-        yield p
+def temp_workdir(tmp_path: Path, monkeypatch) -> Path:
+    for sub in ("config", "data", "logs"):
+        (tmp_path / sub).mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 @pytest.fixture()
 def sample_config_yaml() -> str:
@@ -65,3 +87,70 @@ def capture_logs(monkeypatch, tmp_path: Path):
         logs.append(msg)
     # monkeypatch.setattr("src.logging.core.log", fake_log)  # will patch when module exists
     return logs
+
+@pytest.fixture(scope="session")
+def config_schema_validator():
+    """Compiled validator for contracts/config_schema.json (shared across tests)."""
+    return _compiled_schema_validator("config_schema.json")
+
+@pytest.fixture(scope="session")
+def error_log_schema_validator():
+    """Compiled validator for contracts/error_log_schema.json (shared across tests)."""
+    return _compiled_schema_validator("error_log_schema.json")
+
+def _write_xlsx(path: Path, sheets: dict[str, list[list[object]]]) -> Path:
+    """Write rows straight to an xlsx file (no DataFrame; ragged rows / None allowed)."""
+    try:
+        import xlsxwriter  # type: ignore
+    except ImportError:  # dev extra 未導入時は openpyxl の write_only で同等に書く
+        from openpyxl import Workbook
+
+        wb = Workbook(write_only=True)
+        for sheet_name, rows in sheets.items():
+            ws = wb.create_sheet(sheet_name)
+            for row in rows:
+                ws.append(row)
+        wb.save(path)
+        return path
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    for sheet_name, rows in sheets.items():
+        worksheet = workbook.add_worksheet(sheet_name)
+        for r, row in enumerate(rows):
+            worksheet.write_row(r, 0, row)
+    workbook.close()
+    return path
+
+@pytest.fixture(scope="session")
+def make_excel_file(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[Path, str, dict[str, list[list[object]]]], Path]:
+    """Factory writing a multi-sheet fixture workbook: ``make_excel_file(dir, name, sheets)``.
+
+    書き出し結果はこのセッション専用の一時ディレクトリに内容ハッシュをキーとして
+    キャッシュし、2 回目以降は hard link (不可ならコピー) で配置する。
+    basetemp 配下なので xdist ワーカー間で共有されず、セッション終了後は pytest が管理する。
+    """
+    cache_root = tmp_path_factory.mktemp("excel_cache")
+
+    def _make(directory: Path, name: str, sheets: dict[str, list[list[object]]]) -> Path:
+        key = hashlib.sha256(repr(sheets).encode("utf-8")).hexdigest()[:16]
+        cached = cache_root / f"{key}_{name}"
+        if not cached.exists():
+            _write_xlsx(cached, sheets)
+        target = directory / name
+        try:
+            os.link(cached, target)
+        except OSError:  # 別ファイルシステム等
+            shutil.copyfile(cached, target)
+        return target
+    return _make
+
+@pytest.fixture(scope="session")
+def summary_pattern() -> re.Pattern[str]:
+    """Contract regex for a single SUMMARY line (contracts/summary_output.md)."""
+    return re.compile(SUMMARY_LINE_REGEX)
+
+@pytest.fixture(scope="session")
+def summary_search_pattern() -> re.Pattern[str]:
+    """Contract regex applied per line (MULTILINE) to search full CLI output."""
+    return re.compile(SUMMARY_LINE_REGEX, re.MULTILINE)
@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import json
-import pathlib
-
 import pytest
 import yaml
 
@@ -15,12 +12,9 @@ except ImportError:  # pragma: no cover
 
 """Config schema contract test (FR-026, FR-027)."""
 
-SCHEMA_PATH = pathlib.Path("specs/001-excel-postgressql-excel/contracts/config_schema.json")
-
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_config_schema_valid_example():
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+def test_config_schema_valid_example(config_schema_validator):
     config = {
         "source_directory": "./data",
         "sheet_mappings": {
@@ -49,12 +43,11 @@ def test_config_schema_valid_example():
             "database": "appdb"
         }
     }
-    jsonschema.validate(config, schema)  # type: ignore
+    config_schema_validator.validate(config)
 
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_config_schema_missing_required_key():
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+def test_config_schema_missing_required_key(config_schema_validator):
     # Missing required key 'database'
     config = {
         "source_directory": "./data",
@@ -67,12 +60,11 @@ def test_config_schema_missing_required_key():
         "fk_propagations": {}
     }
     with pytest.raises(ValidationError):
-        jsonschema.validate(config, schema)  # type: ignore
+        config_schema_validator.validate(config)
 
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_config_schema_invalid_sheet_mapping():
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+def test_config_schema_invalid_sheet_mapping(config_schema_validator):
     # Sheet mapping missing required 'table' key
     config = {
         "source_directory": "./data",
@@ -86,12 +78,11 @@ def test_config_schema_invalid_sheet_mapping():
         "database": {}
     }
     with pytest.raises(ValidationError):
-        jsonschema.validate(config, schema)  # type: ignore
+        config_schema_validator.validate(config)
 
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_config_schema_rejects_extra_key():
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+def test_config_schema_rejects_extra_key(config_schema_validator):
     config = {
         "source_directory": "./data",
         "sheet_mappings": {
@@ -105,21 +96,19 @@ def test_config_schema_rejects_extra_key():
         "extra_field": "not allowed"  # Extra field should be rejected
     }
     with pytest.raises(ValidationError):
-        jsonschema.validate(config, schema)  # type: ignore
+        config_schema_validator.validate(config)
 
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_config_schema_validates_from_sample_yaml(sample_config_yaml: str):
+def test_config_schema_validates_from_sample_yaml(sample_config_yaml: str, config_schema_validator):
     """Test that the sample config from conftest.py validates against schema."""
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
     config = yaml.safe_load(sample_config_yaml)
-    jsonschema.validate(config, schema)  # type: ignore
+    config_schema_validator.validate(config)
 
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_config_schema_minimal_valid_config():
+def test_config_schema_minimal_valid_config(config_schema_validator):
     """Test minimal valid config with only required fields."""
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
     config = {
         "source_directory": "./data",
         "sheet_mappings": {
@@ -131,4 +120,4 @@ def test_config_schema_minimal_valid_config():
         "fk_propagations": {},
         "database": {}
     }
-    jsonschema.validate(config, schema)  # type: ignore
\ No newline at end of file
+    config_schema_validator.validate(config)
\ No newline at end of file
@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import json
-import pathlib
-
 import pytest
 
 """Error log JSON schema contract test (FR-030)."""
@@ -12,11 +9,9 @@ try:
 except ImportError:  # pragma: no cover
     jsonschema = None
 
-SCHEMA_PATH = pathlib.Path("specs/001-excel-postgressql-excel/contracts/error_log_schema.json")
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_error_log_schema_valid_example():
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+def test_error_log_schema_valid_example(error_log_schema_validator):
     record = {
         "timestamp": "2025-09-26T10:12:33Z",
         "file": "customers.xlsx",
@@ -25,11 +20,10 @@ def test_error_log_schema_valid_example():
         "error_type": "CONSTRAINT_VIOLATION",
         "db_message": "duplicate key value violates unique constraint 'orders_pkey'"
     }
-    jsonschema.validate(record, schema)  # type: ignore
+    error_log_schema_validator.validate(record)
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_error_log_schema_rejects_extra_key():
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+def test_error_log_schema_rejects_extra_key(error_log_schema_validator):
     record = {
         "timestamp": "2025-09-26T10:12:33Z",
         "file": "customers.xlsx",
@@ -40,4 +34,4 @@ def test_error_log_schema_rejects_extra_key():
         "extra": "not allowed"
     }
     with pytest.raises(jsonschema.exceptions.ValidationError):
-        jsonschema.validate(record, schema)
+        error_log_schema_validator.validate(record)
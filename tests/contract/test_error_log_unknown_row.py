@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import json
-import pathlib
-
 import pytest
 
 """Error log row=-1 sentinel contract test (T007).
@@ -16,52 +13,34 @@ try:
 except ImportError:  # pragma: no cover
     jsonschema = None
 
-SCHEMA_PATH = pathlib.Path("specs/001-excel-postgressql-excel/contracts/error_log_schema.json")
-
-
-@pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_error_log_schema_accepts_row_minus_one():
-    """Test that error log schema accepts row=-1 for file-level fatal errors."""
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
-    record = {
-        "timestamp": "2025-09-26T10:12:33Z",
-        "file": "customers.xlsx",
-        "sheet": "Orders",
-        "row": -1,  # Sentinel value for unknown row
-        "error_type": "FILE_LEVEL_FATAL",
-        "db_message": "Database connection failed during file processing"
-    }
-    # Should not raise ValidationError
-    jsonschema.validate(record, schema)  # type: ignore
-
-
-@pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_error_log_schema_rejects_row_less_than_minus_one():
-    """Test that error log schema rejects row values less than -1."""
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
-    record = {
-        "timestamp": "2025-09-26T10:12:33Z",
-        "file": "customers.xlsx",
-        "sheet": "Orders",
-        "row": -2,  # Invalid: less than minimum -1
-        "error_type": "CONSTRAINT_VIOLATION",
-        "db_message": "duplicate key value violates unique constraint"
-    }
-    with pytest.raises(jsonschema.exceptions.ValidationError):
-        jsonschema.validate(record, schema)
-
 
 @pytest.mark.skipif(jsonschema is None, reason="jsonschema library not installed")
-def test_error_log_schema_accepts_positive_row_numbers():
-    """Test that error log schema accepts positive row numbers (normal case)."""
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+@pytest.mark.parametrize(
+    ("row", "error_type", "db_message", "valid"),
+    [
+        # Sentinel value for unknown row (file-level fatal errors)
+        (-1, "FILE_LEVEL_FATAL", "Database connection failed during file processing", True),
+        # Invalid: less than minimum -1
+        (-2, "CONSTRAINT_VIOLATION", "duplicate key value violates unique constraint", False),
+        # Normal positive row number
+        (42, "CONSTRAINT_VIOLATION", "duplicate key value violates unique constraint", True),
+    ],
+    ids=["accepts_row_minus_one", "rejects_row_less_than_minus_one", "accepts_positive_row"],
+)
+def test_error_log_schema_row_bounds(
+    error_log_schema_validator, row, error_type, db_message, valid
+):
+    """Error log schema accepts row >= -1 (-1 = unknown row) and rejects anything lower."""
     record = {
         "timestamp": "2025-09-26T10:12:33Z",
         "file": "customers.xlsx",
         "sheet": "Orders",
-        "row": 42,  # Normal positive row number
-        "error_type": "CONSTRAINT_VIOLATION",
-        "db_message": "duplicate key value violates unique constraint"
+        "row": row,
+        "error_type": error_type,
+        "db_message": db_message
     }
-    # Should not raise ValidationError
-    jsonschema.validate(record, schema)  # type: ignore
\ No newline at end of file
+    if valid:
+        error_log_schema_validator.validate(record)
+    else:
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            error_log_schema_validator.validate(record)
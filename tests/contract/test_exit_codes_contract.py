@@ -12,25 +12,20 @@ from src.logging.init import reset_logging
 
 PROJECT_ROOT = _P(__file__).resolve().parents[2]  # /workspaces/iwk_db-import
 
+FAILED_PATTERN = re.compile(r"failed=(\d+)")
+
 
 def test_exit_code_fatal_startup(temp_workdir: Path, capsys):
-    # config/import.yml 無し → exit 1
-    import os
+    # config/import.yml 無し → exit 1 (cwd は temp_workdir が monkeypatch.chdir 済み)
     reset_logging()  # Ensure clean logging state
     
-    cwd_before = os.getcwd()
-    try:
-        os.chdir(temp_workdir)
-        code = cli_main([])
-    finally:
-        os.chdir(cwd_before)
+    code = cli_main([])
     captured = capsys.readouterr()
     assert code == 1
     assert "ERROR config:" in captured.out
 
 
 def test_exit_code_all_success(temp_workdir: Path, write_config, dummy_excel_files, capsys):
-    import os
     reset_logging()  # Ensure clean logging state
     
     # Mock Excel processing to simulate successful processing
@@ -49,12 +44,7 @@ def test_exit_code_all_success(temp_workdir: Path, write_config, dummy_excel_fil
             mock_read.side_effect = mock_read_side_effect
             mock_normalize.return_value = mock_sheet_data
             
-            cwd_before = os.getcwd()
-            try:
-                os.chdir(temp_workdir)
-                code = cli_main([])
-            finally:
-                os.chdir(cwd_before)
+            code = cli_main([])
     
     out = capsys.readouterr().out
     assert code == 0
@@ -64,7 +54,6 @@ def test_exit_code_all_success(temp_workdir: Path, write_config, dummy_excel_fil
 
 def test_exit_code_partial_failure(temp_workdir: Path, write_config, capsys):
     """Test exit code 2 when some files fail but others succeed."""
-    import os
     reset_logging()  # Ensure clean logging state
     
     # Create two Excel files - one will be simulated as failing  
@@ -91,12 +80,7 @@ def test_exit_code_partial_failure(temp_workdir: Path, write_config, capsys):
             mock_read.side_effect = mock_read_side_effect
             mock_normalize.return_value = mock_sheet_data
             
-            cwd_before = os.getcwd()
-            try:
-                os.chdir(temp_workdir)
-                code = cli_main([])
-            finally:
-                os.chdir(cwd_before)
+            code = cli_main([])
     
     out = capsys.readouterr().out
     
@@ -108,7 +92,7 @@ def test_exit_code_partial_failure(temp_workdir: Path, write_config, capsys):
     assert "failed=" in out
     # At least one file should have failed (failed>0)
     # Extract failed count and verify it's > 0
-    match = re.search(r"failed=(\d+)", out)
+    match = FAILED_PATTERN.search(out)
     assert match is not None, f"No 'failed=' found in output: {out}"
     failed_count = int(match.group(1))
     assert failed_count > 0, f"Expected failed > 0, got {failed_count}"
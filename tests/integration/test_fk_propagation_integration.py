@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import shutil
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -23,32 +24,23 @@ is built, including FK propagation service logic and database operations with RE
 """
 
 
-def _make_excel_file(
-    tmp_path: Path, name: str, sheets: dict[str, list[list[object]]]
-) -> Path:
-    """Create a real Excel file with multiple sheets for testing."""
-    excel_path = tmp_path / name
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        for sheet_name, rows in sheets.items():
-            df = pd.DataFrame(rows)
-            df.to_excel(writer, sheet_name=sheet_name, header=False, index=False)
-    return excel_path
+def _isna(value: object) -> bool:
+    """Scalar NaN/None check without pd.isna's array dispatch (NaN != NaN)."""
+    return value is None or value != value
 
 
-@pytest.fixture
-def fk_propagation_excel_setup(temp_workdir: Path, write_config: Any) -> dict[str, Any]:
-    """Create Excel file with parent-child sheets that require FK propagation.
+@pytest.fixture(scope="module")
+def fk_propagation_workbook(
+    tmp_path_factory: pytest.TempPathFactory, make_excel_file: Any
+) -> Path:
+    """Build the parent-child workbook once per module (xlsx writes are slow).
     
-    The setup creates:
+    The workbook contains:
     - Customers sheet (parent): generates customer_id via sequence
     - Orders sheet (child): references customer_id from Customers via FK propagation
     """
-    data_dir = temp_workdir / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create Excel file with parent and child sheets
-    fk_propagation_excel = _make_excel_file(
-        data_dir, "fk_propagation_test.xlsx",
+    return make_excel_file(
+        tmp_path_factory.mktemp("fk_prop"), "fk_propagation_test.xlsx",
         {
             # Parent sheet: Customers (will generate PKs via sequence)
             "Customers": [
@@ -69,6 +61,17 @@ def fk_propagation_excel_setup(temp_workdir: Path, write_config: Any) -> dict[st
             ]
         }
     )
+
+
+@pytest.fixture
+def fk_propagation_excel_setup(
+    temp_workdir: Path, write_config: Any, fk_propagation_workbook: Path
+) -> dict[str, Any]:
+    """Copy the shared FK propagation workbook into this test's data directory."""
+    data_dir = temp_workdir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    fk_propagation_excel = data_dir / fk_propagation_workbook.name
+    shutil.copyfile(fk_propagation_workbook, fk_propagation_excel)
     
     return {
         'excel_file': fk_propagation_excel,
@@ -98,7 +101,8 @@ def fk_propagation_excel_setup(temp_workdir: Path, write_config: Any) -> dict[st
     "implement after orchestration service with RETURNING support"
 )
 def test_fk_propagation_integration(
-    temp_workdir: Path, fk_propagation_excel_setup: dict[str, Any], capsys: Any
+    temp_workdir: Path, fk_propagation_excel_setup: dict[str, Any], capsys: Any,
+    summary_search_pattern: re.Pattern[str],
 ) -> None:
     """Test FK propagation: parent sheet generates PKs, child sheet receives propagated FKs.
     
@@ -111,8 +115,6 @@ def test_fk_propagation_integration(
     6. Exit code is 0 (success)
     7. FK propagation mapping works correctly (Alice -> 101, Bob -> 102, etc.)
     """
-    import os
-    
     setup = fk_propagation_excel_setup
     
     # Mock database operations to simulate FK propagation workflow
@@ -170,12 +172,7 @@ def test_fk_propagation_integration(
             
             mock_fk_service.side_effect = mock_propagate_fks
             
-            cwd_before = os.getcwd()
-            try:
-                os.chdir(temp_workdir)
-                exit_code = cli_main([])
-            finally:
-                os.chdir(cwd_before)
+            exit_code = cli_main([])
     
     captured = capsys.readouterr()
     output = captured.out
@@ -184,14 +181,7 @@ def test_fk_propagation_integration(
     assert exit_code == 0, f"Expected exit code 0 (success), got {exit_code}"
     
     # Verify SUMMARY line matches contract format and includes both parent and child rows
-    summary_pattern = re.compile(
-        r"^SUMMARY\s+files=(\d+)/(\d+)\s+success=(\d+)\s+failed=(\d+)\s+"
-        r"rows=(\d+)\s+skipped_sheets=(\d+)\s+elapsed_sec=(\d+\.?\d*)\s+"
-        r"throughput_rps=(\d+\.?\d*)$", 
-        re.MULTILINE
-    )
-    
-    match = summary_pattern.search(output)
+    match = summary_search_pattern.search(output)
     assert match is not None, f"SUMMARY line not found or malformed in output: {output}"
     
     # Extract and verify SUMMARY values
@@ -237,14 +227,16 @@ def test_fk_propagation_excel_fixture_creates_valid_files(
     # Verify file exists
     assert setup['excel_file'].exists(), "fk_propagation_test.xlsx should exist"
     
-    # Verify file is readable by pandas
-    excel_data = pd.ExcelFile(setup['excel_file'])
+    # Verify file is readable by pandas (全シートを 1 回の読み込みで取得)
+    sheets = pd.read_excel(
+        setup['excel_file'], sheet_name=None, header=None
+    )
     
     # Verify sheet names
-    assert set(excel_data.sheet_names) == {"Customers", "Orders"}
+    assert set(sheets) == {"Customers", "Orders"}
     
     # Verify parent sheet structure (Customers)
-    customers_df = excel_data.parse("Customers", header=None)
+    customers_df = sheets["Customers"]
     assert len(customers_df) == 5, (
         "Expected 5 rows in Customers sheet (title + header + 3 data rows)"
     )
@@ -253,18 +245,18 @@ def test_fk_propagation_excel_fixture_creates_valid_files(
     assert customers_df.iloc[2, 1] == "Alice", "Third row should contain 'Alice'"
     
     # Verify parent sheet has empty id column (will be populated by sequence)
-    assert pd.isna(customers_df.iloc[2, 0]), (
+    assert _isna(customers_df.iloc[2, 0]), (
         "Parent id column should be empty/NaN (sequence-generated)"
     )
-    assert pd.isna(customers_df.iloc[3, 0]), (
+    assert _isna(customers_df.iloc[3, 0]), (
         "Parent id column should be empty/NaN (sequence-generated)"
     )
-    assert pd.isna(customers_df.iloc[4, 0]), (
+    assert _isna(customers_df.iloc[4, 0]), (
         "Parent id column should be empty/NaN (sequence-generated)"
     )
     
     # Verify child sheet structure (Orders)
-    orders_df = excel_data.parse("Orders", header=None)
+    orders_df = sheets["Orders"]
     assert len(orders_df) == 6, "Expected 6 rows in Orders sheet (title + header + 4 data rows)"
     assert orders_df.iloc[1, 0] == "id", "Second row should be header with 'id'"
     assert orders_df.iloc[1, 1] == "customer_id", "Second row should be header with 'customer_id'"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import shutil
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -25,27 +26,16 @@ is built, including database operations with transaction rollback handling.
 """
 
 
-def _make_excel_file(
-    tmp_path: Path, name: str, sheets: dict[str, list[list[object]]]
-) -> Path:
-    """Create a real Excel file with multiple sheets for testing."""
-    excel_path = tmp_path / name
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        for sheet_name, rows in sheets.items():
-            df = pd.DataFrame(rows)
-            df.to_excel(writer, sheet_name=sheet_name, header=False, index=False)
-    return excel_path
-
-
-@pytest.fixture
-def partial_failure_excel_setup(temp_workdir: Path, write_config: Any) -> dict[str, Any]:
-    """Create Excel files: one successful, one that will cause constraint violation."""
-    data_dir = temp_workdir / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture(scope="module")
+def partial_failure_workbooks(
+    tmp_path_factory: pytest.TempPathFactory, make_excel_file: Any
+) -> tuple[Path, Path]:
+    """Build the successful/failing workbooks once per module (xlsx writes are slow)."""
+    build_dir = tmp_path_factory.mktemp("partial_failure")
     
     # File 1: successful_file.xlsx - should succeed
-    successful_excel = _make_excel_file(
-        data_dir, "successful_file.xlsx",
+    successful_excel = make_excel_file(
+        build_dir, "successful_file.xlsx",
         {
             "Customers": [
                 ["Customer Data", "Sheet 1"],  # Title row (ignored)
@@ -58,8 +48,8 @@ def partial_failure_excel_setup(temp_workdir: Path, write_config: Any) -> dict[s
     
     # File 2: constraint_violation.xlsx - designed to fail with constraint violation
     # Using a filename that signals constraint violation for test simulation
-    failing_excel = _make_excel_file(
-        data_dir, "constraint_violation.xlsx",
+    failing_excel = make_excel_file(
+        build_dir, "constraint_violation.xlsx",
         {
             "Customers": [
                 ["Customer Data", "Sheet 1"],  # Title row (ignored) 
@@ -70,6 +60,19 @@ def partial_failure_excel_setup(temp_workdir: Path, write_config: Any) -> dict[s
             ],
         }
     )
+    return successful_excel, failing_excel
+
+
+@pytest.fixture
+def partial_failure_excel_setup(
+    temp_workdir: Path, write_config: Any, partial_failure_workbooks: tuple[Path, Path]
+) -> dict[str, Any]:
+    """Copy the shared workbooks (one successful, one constraint violation) into data/."""
+    data_dir = temp_workdir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    successful_excel, failing_excel = (
+        shutil.copyfile(src, data_dir / src.name) for src in partial_failure_workbooks
+    )
     
     return {
         'successful_file': successful_excel,
@@ -84,7 +87,8 @@ def partial_failure_excel_setup(temp_workdir: Path, write_config: Any) -> dict[s
 
 # Skip removed - using orchestrator mocking similar to contract tests
 def test_partial_failure_rollback_integration(
-    temp_workdir: Path, partial_failure_excel_setup: dict[str, Any], capsys: Any
+    temp_workdir: Path, partial_failure_excel_setup: dict[str, Any], capsys: Any,
+    summary_search_pattern: re.Pattern[str],
 ) -> None:
     """Test partial failure: one file violates constraint → rollback, other commits successfully.
     
@@ -97,8 +101,6 @@ def test_partial_failure_rollback_integration(
     6. Error log contains constraint violation details
     7. Only successful file's rows are counted in total
     """
-    import os
-
     from src.logging.init import reset_logging
     
     reset_logging()  # Ensure clean logging state
@@ -125,13 +127,8 @@ def test_partial_failure_rollback_integration(
     
     with patch('src.cli.__main__.process_all') as mock_process:
         mock_process.return_value = mock_result
-        
-        cwd_before = os.getcwd()
-        try:
-            os.chdir(temp_workdir)
-            exit_code = cli_main([])
-        finally:
-            os.chdir(cwd_before)
+        # temp_workdir が monkeypatch.chdir 済み (テスト終了時に自動で元に戻る)
+        exit_code = cli_main([])
     
     captured = capsys.readouterr()
     output = captured.out
@@ -140,14 +137,7 @@ def test_partial_failure_rollback_integration(
     assert exit_code == 2, f"Expected exit code 2 (partial failure), got {exit_code}"
     
     # Verify SUMMARY line matches contract format for partial failure
-    summary_pattern = re.compile(
-        r"^SUMMARY\s+files=(\d+)/(\d+)\s+success=(\d+)\s+failed=(\d+)\s+"
-        r"rows=(\d+)\s+skipped_sheets=(\d+)\s+elapsed_sec=(\d+\.?\d*)\s+"
-        r"throughput_rps=(\d+\.?\d*)$", 
-        re.MULTILINE
-    )
-    
-    match = summary_pattern.search(output)
+    match = summary_search_pattern.search(output)
     assert match is not None, f"SUMMARY line not found or malformed in output: {output}"
     
     # Extract and verify SUMMARY values for partial failure
@@ -194,16 +184,20 @@ def test_partial_failure_excel_fixture_creates_valid_files(
     assert setup['failing_file'].exists(), "constraint_violation.xlsx should exist"
     
     # Verify files are readable by pandas
-    successful_data = pd.ExcelFile(setup['successful_file'])
-    failing_data = pd.ExcelFile(setup['failing_file'])
+    successful_data = pd.read_excel(
+        setup['successful_file'], sheet_name=None, header=None
+    )
+    failing_data = pd.read_excel(
+        setup['failing_file'], sheet_name=None, header=None
+    )
     
     # Verify sheet names
-    assert set(successful_data.sheet_names) == {"Customers"}
-    assert set(failing_data.sheet_names) == {"Customers"}
+    assert set(successful_data) == {"Customers"}
+    assert set(failing_data) == {"Customers"}
     
     # Verify sheet structure (spot check)
-    successful_df = successful_data.parse("Customers", header=None)
-    failing_df = failing_data.parse("Customers", header=None)
+    successful_df = successful_data["Customers"]
+    failing_df = failing_data["Customers"]
     
     assert len(successful_df) == 4, (
         "Expected 4 rows in successful file (title + header + 2 data rows)"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import shutil
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -20,26 +21,15 @@ is built, including database operations and actual Excel processing.
 """
 
 
-def _make_excel_file(
-    tmp_path: Path, name: str, sheets: dict[str, list[list[object]]]
-) -> Path:
-    """Create a real Excel file with multiple sheets for testing."""
-    excel_path = tmp_path / name
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        for sheet_name, rows in sheets.items():
-            df = pd.DataFrame(rows)
-            df.to_excel(writer, sheet_name=sheet_name, header=False, index=False)
-    return excel_path
-
-
-@pytest.fixture
-def multi_file_excel_setup(temp_workdir: Path, write_config: Any) -> dict[str, Any]:
-    """Create 2 Excel files with multiple sheets containing test data."""
-    data_dir = temp_workdir / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture(scope="module")
+def multi_file_workbooks(
+    tmp_path_factory: pytest.TempPathFactory, make_excel_file: Any
+) -> tuple[Path, Path]:
+    """Build the 2 multi-sheet workbooks once per module (xlsx writes are slow)."""
+    build_dir = tmp_path_factory.mktemp("multi_file")
     # File 1: customers.xlsx with 2 sheets
-    customers_excel = _make_excel_file(
-        data_dir, "customers.xlsx",
+    customers_excel = make_excel_file(
+        build_dir, "customers.xlsx",
         {
             "Customers": [
                 ["Customer Data", "Sheet 1"],  # Title row (ignored)
@@ -59,8 +49,8 @@ def multi_file_excel_setup(temp_workdir: Path, write_config: Any) -> dict[str, A
     )
     
     # File 2: orders.xlsx with 2 sheets  
-    orders_excel = _make_excel_file(
-        data_dir, "orders.xlsx", 
+    orders_excel = make_excel_file(
+        build_dir, "orders.xlsx", 
         {
             "Orders": [
                 ["Order Information"],           # Title row (ignored)
@@ -82,6 +72,19 @@ def multi_file_excel_setup(temp_workdir: Path, write_config: Any) -> dict[str, A
             ]
         }
     )
+    return customers_excel, orders_excel
+
+
+@pytest.fixture
+def multi_file_excel_setup(
+    temp_workdir: Path, write_config: Any, multi_file_workbooks: tuple[Path, Path]
+) -> dict[str, Any]:
+    """Copy the shared multi-file workbooks into this test's data directory."""
+    data_dir = temp_workdir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    customers_excel, orders_excel = (
+        shutil.copyfile(src, data_dir / src.name) for src in multi_file_workbooks
+    )
     
     return {
         'customers_file': customers_excel,
@@ -94,7 +97,8 @@ def multi_file_excel_setup(temp_workdir: Path, write_config: Any) -> dict[str, A
 
 # Skip removed - using orchestrator mocking similar to contract tests
 def test_multi_file_run_success_integration(
-    temp_workdir: Path, multi_file_excel_setup: dict[str, Any], capsys: Any
+    temp_workdir: Path, multi_file_excel_setup: dict[str, Any], capsys: Any,
+    summary_search_pattern: re.Pattern[str],
 ) -> None:
     """Test successful processing of 2 Excel files with multiple sheets each.
     
@@ -106,8 +110,6 @@ def test_multi_file_run_success_integration(
     5. Exit code is 0 (success)
     6. Database operations are mocked but verify insert calls
     """
-    import os
-
     from src.logging.init import reset_logging
     
     reset_logging()  # Ensure clean logging state
@@ -134,13 +136,8 @@ def test_multi_file_run_success_integration(
     
     with patch('src.cli.__main__.process_all') as mock_process:
         mock_process.return_value = mock_result
-        
-        cwd_before = os.getcwd()
-        try:
-            os.chdir(temp_workdir)
-            exit_code = cli_main([])
-        finally:
-            os.chdir(cwd_before)
+        # temp_workdir が monkeypatch.chdir 済み (テスト終了時に自動で元に戻る)
+        exit_code = cli_main([])
     
     captured = capsys.readouterr()
     output = captured.out
@@ -149,14 +146,7 @@ def test_multi_file_run_success_integration(
     assert exit_code == 0, f"Expected exit code 0 (success), got {exit_code}"
     
     # Verify SUMMARY line matches contract format and values
-    summary_pattern = re.compile(
-        r"^SUMMARY\s+files=(\d+)/(\d+)\s+success=(\d+)\s+failed=(\d+)\s+"
-        r"rows=(\d+)\s+skipped_sheets=(\d+)\s+elapsed_sec=(\d+\.?\d*)\s+"
-        r"throughput_rps=(\d+\.?\d*)$", 
-        re.MULTILINE
-    )
-    
-    match = summary_pattern.search(output)
+    match = summary_search_pattern.search(output)
     assert match is not None, f"SUMMARY line not found or malformed in output: {output}"
     
     # Extract and verify SUMMARY values
@@ -199,15 +189,19 @@ def test_multi_file_excel_fixture_creates_valid_files(
     assert setup['orders_file'].exists(), "orders.xlsx should exist"
     
     # Verify files are readable by pandas
-    customers_data = pd.ExcelFile(setup['customers_file'])
-    orders_data = pd.ExcelFile(setup['orders_file'])
+    customers_data = pd.read_excel(
+        setup['customers_file'], sheet_name=None, header=None
+    )
+    orders_data = pd.read_excel(
+        setup['orders_file'], sheet_name=None, header=None
+    )
     
     # Verify sheet names
-    assert set(customers_data.sheet_names) == {"Customers", "CustomerProfiles"}
-    assert set(orders_data.sheet_names) == {"Orders", "OrderItems"}
+    assert set(customers_data) == {"Customers", "CustomerProfiles"}
+    assert set(orders_data) == {"Orders", "OrderItems"}
     
     # Verify sheet structure (spot check one sheet)
-    customers_df = customers_data.parse("Customers", header=None)
+    customers_df = customers_data["Customers"]
     assert len(customers_df) == 5, "Expected 5 rows (title + header + 3 data rows)"
     assert customers_df.iloc[1, 0] == "id", "Second row should be header with 'id'"
     assert customers_df.iloc[2, 1] == "Alice", "Third row should contain 'Alice'"
@@ -94,13 +94,12 @@ def test_batch_insert_metrics_callback(monkeypatch):
     calls: list[tuple] = []
     def fake_execute_values(cur, sql, rows, page_size=100, fetch=False):  # noqa: D401
         calls.append((sql, list(rows)))
-        # fetch=True の場合を想定しない (batch_insert 後で fetchall 呼ぶ)
-        return None
+        # RETURNING は fetch=True で全ページ分を戻り値として受け取る
+        return [(1,), (2,)] if fetch else None
     monkeypatch.setattr(bi_mod, 'execute_values', fake_execute_values)
 
     class DummyCursor:
-        def fetchall(self):
-            return [(1,), (2,)]
+        pass
     cur = DummyCursor()
     metrics: list[BatchMetrics] = []
     def cb(m: BatchMetrics):
@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import pytest
 
-from src.db.batch_insert import BatchInsertError, InsertResult, batch_insert
+from src.db.batch_insert import BatchInsertError, InsertResult, batch_insert, copy_insert
 
 
 class DummyCursor:
     def __init__(self) -> None:
         self.queries: list[str] = []
-        self.fetched: list[tuple] = [(1,), (2,)]
+        self.fetched: list[tuple] = []
         self.template: str | None = None
+        self.next_pk = 1
     def fetchall(self):
         return self.fetched
+    def copy_expert(self, sql, file):
+        self.queries.append(sql)
+        self.copied = file.read()
 
 # We monkeypatch execute_values symbol inside module to avoid needing
 # psycopg2 real dependency for logic test
@@ -19,11 +23,20 @@ class DummyCursor:
 @pytest.fixture(autouse=True)
 def patch_execute_values(monkeypatch):
     import src.db.batch_insert as bi
-    def fake_execute_values(cursor, sql, rows, page_size=1000, template=None):  # noqa: D401
+    def fake_execute_values(  # noqa: D401
+        cursor, sql, rows, page_size=1000, template=None, fetch=False
+    ):
         cursor.queries.append(sql)
         if template:
             cursor.template = template  # Store template for assertion in tests
-        # simulate doing nothing else
+        # psycopg2 同様: ページ毎に実行し fetchall() で見えるのは最終ページのみ
+        result = []
+        for start in range(0, len(rows), page_size):
+            page = rows[start:start + page_size]
+            cursor.fetched = [(cursor.next_pk + i,) for i in range(len(page))]
+            cursor.next_pk += len(page)
+            result.extend(cursor.fetched)
+        return result if fetch else None
     monkeypatch.setattr(bi, "execute_values", fake_execute_values)
     return fake_execute_values
 
@@ -44,6 +57,24 @@ def test_batch_insert_returning():
     assert res.returned_values == [(1,), (2,)]
 
 
+def test_batch_insert_returning_collects_every_page():
+    """RETURNING rows come back for all pages, not just the last (rows > page_size)."""
+    cur = DummyCursor()
+    res = batch_insert(
+        cur, table="customers", columns=["id"], rows=[[i] for i in range(25)],
+        returning=True, page_size=10,
+    )
+    assert res.returned_values == [(pk,) for pk in range(1, 26)]
+    assert len(cur.fetched) == 5  # fetchall() だけでは最終ページ 5 行に切り詰められる
+
+
+def test_batch_insert_returning_explicit_columns():
+    cur = DummyCursor()
+    batch_insert(cur, table="customers", columns=["name"], rows=[["A"]], returning=True,
+                 returning_columns=["id"])
+    assert cur.queries[0].endswith('VALUES %s RETURNING "id"')
+
+
 def test_batch_insert_empty_rows():
     cur = DummyCursor()
     res = batch_insert(cur, table="customers", columns=["id"], rows=[], returning=False)
@@ -179,7 +210,7 @@ def test_batch_insert_with_blob_and_returning(tmp_path):
         blob_columns={"content"},
         source_directory=str(tmp_path),
     )
-    assert res.returned_values == [(1,), (2,)]
+    assert res.returned_values == [(1,)]
     assert "RETURNING *" in cur.queries[0]
     # No template - binary data is passed directly
     assert cur.template is None
@@ -284,3 +315,63 @@ def test_batch_insert_blob_columns_not_in_insert_columns(tmp_path):
     assert res.inserted_rows == 1
     assert cur.template is None
     assert "VALUES %s" in cur.queries[0]
+
+
+def test_copy_insert_escapes_values(tmp_path):
+    """COPY text format: NULL as \\N, special chars escaped, bytea as hex."""
+    blob = tmp_path / "b.bin"
+    blob.write_bytes(b"\x01\xff")
+    cur = DummyCursor()
+    res = copy_insert(
+        cur,
+        table="files",
+        columns=["id", "name", "flag", "content"],
+        rows=[[1, "a\tb\nc\\d", True, "b.bin"], [2, None, False, None]],
+        blob_columns={"content"},
+        source_directory=str(tmp_path),
+    )
+    assert res == InsertResult(inserted_rows=2, returned_values=None)
+    assert cur.queries == [
+        'COPY files ("id","name","flag","content") FROM STDIN WITH (FORMAT text)'
+    ]
+    assert cur.copied == (
+        "1\ta\\tb\\nc\\\\d\tt\t\\\\x01ff\n"
+        "2\t\\N\tf\t\\N\n"
+    )
+
+
+def test_copy_insert_adapts_excel_value_types():
+    """Values as produced by the Excel reader (numpy / NaN / pandas NA) are type-mapped."""
+    import datetime as dt
+
+    import numpy as np
+    import pandas as pd
+
+    cur = DummyCursor()
+    copy_insert(
+        cur,
+        table="t",
+        columns=["qty", "flag", "amount", "missing", "ts"],
+        rows=[
+            [
+                np.float64(1.0), np.bool_(True), np.float64(12.5), float("nan"),
+                pd.Timestamp("2024-01-02 03:04:05"),
+            ],
+            [np.int64(7), np.bool_(False), 0.1, pd.NA, np.datetime64("2024-01-02T03:04:05")],
+            [3.0, True, np.float32(2.5), pd.NaT, dt.date(2024, 1, 2)],
+            [None, None, None, np.datetime64("NaT"), None],
+        ],
+    )
+    assert cur.copied == (
+        "1\tt\t12.5\t\\N\t2024-01-02T03:04:05\n"
+        "7\tf\t0.1\t\\N\t2024-01-02T03:04:05.000000\n"
+        "3\tt\t2.5\t\\N\t2024-01-02\n"
+        "\\N\t\\N\t\\N\t\\N\t\\N\n"
+    )
+
+
+def test_copy_insert_empty_rows_skips_copy():
+    cur = DummyCursor()
+    res = copy_insert(cur, table="t", columns=["c"], rows=[])
+    assert res.inserted_rows == 0
+    assert cur.queries == []
@@ -51,3 +51,11 @@ def test_load_config_extra_field(write_config: Path):
     with pytest.raises(ConfigError) as e:
         load_config(write_config)
     assert "config validation failed" in str(e.value)
+
+
+def test_load_config_excel_engine(write_config: Path):
+    assert load_config(write_config).excel_engine is None
+    write_config.write_text(
+        write_config.read_text(encoding="utf-8") + "excel_engine: calamine\n", encoding="utf-8"
+    )
+    assert load_config(write_config).excel_engine == "calamine"
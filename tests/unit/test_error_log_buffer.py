@@ -52,3 +52,14 @@ def test_error_log_buffer_multiple_flushes(temp_workdir: Path):
     assert path == path2
     size2 = path2.stat().st_size
     assert size2 > size1
+
+
+def test_error_log_buffer_extend(temp_workdir: Path):
+    buf = ErrorLogBuffer()
+    buf.extend(
+        ErrorRecord.create("f1.xlsx", "<FILE_LEVEL>", -1, "TRANSACTION_COMMIT_ERROR", "boom")
+        for _ in range(3)
+    )
+    assert len(buf) == 3
+    lines = buf.flush().read_text(encoding="utf-8").splitlines()
+    assert [json.loads(raw)["error_type"] for raw in lines] == ["TRANSACTION_COMMIT_ERROR"] * 3
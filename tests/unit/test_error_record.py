@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 
 from src.models.error_record import ErrorRecord
 
@@ -64,4 +65,37 @@ def test_error_record_zero_row():
     assert rec.row == 0
     line = rec.to_json_line()
     data = json.loads(line)
-    assert data["row"] == 0
\ No newline at end of file
+    assert data["row"] == 0
+
+def test_error_record_timestamp_keeps_microseconds():
+    """Timestamp matches datetime.isoformat() (microseconds, 'Z' suffix) within a cached second."""
+    ts_ns = 1_758_881_553_250_000_000  # 2025-09-26T10:12:33.25Z
+    first = ErrorRecord.create("a.xlsx", "S", 1, "X", "m", ts_ns=ts_ns)
+    second = ErrorRecord.create("a.xlsx", "S", 2, "X", "m", ts_ns=ts_ns + 500_123_000)
+    later = ErrorRecord.create("a.xlsx", "S", 3, "X", "m", ts_ns=ts_ns + 750_000_000)
+
+    assert first.timestamp == "2025-09-26T10:12:33.250000Z"
+    assert second.timestamp == "2025-09-26T10:12:33.750123Z"
+    assert later.timestamp == "2025-09-26T10:12:34Z"
+
+
+def test_error_record_timestamp_cache_is_per_thread():
+    """Concurrent threads formatting different seconds never see each other's cache."""
+    base_ns = 1_758_881_553_000_000_000
+    mismatches: list[str] = []
+
+    def worker(offset: int) -> None:
+        ts_ns = base_ns + offset * 1_000_000_000
+        expected = ErrorRecord.create("a.xlsx", "S", 1, "X", "m", ts_ns=ts_ns).timestamp
+        for _ in range(2_000):
+            ts = ErrorRecord.create("a.xlsx", "S", 1, "X", "m", ts_ns=ts_ns).timestamp
+            if ts != expected:
+                mismatches.append(ts)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert mismatches == []
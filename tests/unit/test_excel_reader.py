@@ -5,7 +5,14 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from src.excel.reader import MissingColumnsError, SheetHeaderError, normalize_sheet, read_excel_file
+from src.excel.reader import (
+    MissingColumnsError,
+    SheetHeaderError,
+    iter_sheet_rows,
+    normalize_sheet,
+    read_excel_file,
+    resolve_engine,
+)
 
 
 def _make_excel(tmp_path: Path, name: str, sheets: dict[str, list[list[object]]]) -> Path:
@@ -86,6 +93,9 @@ def test_normalize_ignores_empty_trailing_rows(temp_workdir: Path):
     assert len(sheet.rows) == 2
     assert sheet.rows[0]["id"] == 1
     assert sheet.rows[1]["id"] == 2
+    # 列指向で保持 (行 dict は rows プロパティで都度生成)
+    assert sheet.row_count == 2
+    assert sheet.columns_data == {"id": [1, 2], "name": ["Alice", "Bob"]}
 
 
 def test_read_excel_file_target_sheets_filter(temp_workdir: Path):
@@ -100,3 +110,59 @@ def test_read_excel_file_target_sheets_filter(temp_workdir: Path):
     assert set(dfs_all.keys()) == {"A", "B"}
     dfs_filtered = read_excel_file(excel, target_sheets=["B"])
     assert set(dfs_filtered.keys()) == {"B"}
+
+
+def test_iter_sheet_rows_yields_tuples_lazily():
+    df = pd.DataFrame([
+        ["Title", None],
+        ["id", "name"],
+        [1, "Alice"],
+        [None, None],  # skipped
+        [2, "NULL"],
+    ])
+    columns, rows = iter_sheet_rows(df, "S", null_sentinels={"NULL"})
+    assert columns == ["id", "name"]
+    assert not isinstance(rows, list)
+    assert next(rows) == (1, "Alice")
+    assert list(rows) == [(2, None)]
+
+
+def test_iter_sheet_rows_validates_header_eagerly():
+    df = pd.DataFrame([["Title"], ["id"]])
+    with pytest.raises(MissingColumnsError):
+        iter_sheet_rows(df, "S", expected_columns={"id", "name"})
+
+
+def test_normalize_header_only_sheet_is_empty():
+    df = pd.DataFrame([["Title", None], ["id", "name"]])
+    sheet = normalize_sheet(df, "S")
+    assert sheet.columns == ["id", "name"]
+    assert sheet.is_empty
+
+
+def test_resolve_engine_default_and_unknown():
+    assert resolve_engine(None) is None
+    assert resolve_engine("openpyxl") == "openpyxl"
+    with pytest.raises(ValueError, match="unsupported excel_engine"):
+        resolve_engine("xlrd")
+
+
+def test_resolve_engine_calamine_missing_falls_back(monkeypatch):
+    import importlib.util
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert resolve_engine("calamine") is None
+
+
+def test_read_excel_file_calamine_matches_openpyxl(temp_workdir: Path):
+    pytest.importorskip("python_calamine")
+    excel = _make_excel(
+        temp_workdir, "engines.xlsx",
+        {"Customers": [["Title", None], ["id", "name"], [1, "Alice"], [2, "Bob"]]},
+    )
+    default = normalize_sheet(read_excel_file(excel)["Customers"], "Customers")
+    fast = normalize_sheet(
+        read_excel_file(excel, engine=resolve_engine("calamine"))["Customers"], "Customers"
+    )
+    assert fast.columns == default.columns
+    assert [r["name"] for r in fast.rows] == ["Alice", "Bob"]
@@ -10,6 +10,7 @@ from src.services.fk_propagation import (
     FKPropagationMap,
     ParentPKResult,
     build_fk_propagation_maps,
+    build_parent_child_tables,
     build_parent_pk_map,
     get_column_index,
     needs_returning,
@@ -382,6 +383,31 @@ def test_needs_returning_with_invalid_format_mappings() -> None:
     assert needs_returning("no_dot_parent", config, processed_tables) is False
 
 
+def test_build_parent_child_tables_list_format() -> None:
+    """Parent -> child table index covers the list format and skips invalid entries."""
+    config = ImportConfig(
+        source_directory="test_data",
+        sheet_mappings={},
+        sequences={},
+        fk_propagations=[
+            {"parent": "customers.name", "child": "orders.customer_id"},
+            {"parent": "customers.email", "child": "addresses.customer_id"},
+            {"parent": "orders.code", "child": "order_lines.order_id"},
+            {"parent": "no_dot", "child": "x.y"},
+            "not-a-dict",
+        ],
+        timezone="UTC",
+        database=DatabaseConfig(
+            host=None, port=None, user=None, password=None, database=None, dsn=None
+        )
+    )
+
+    assert build_parent_child_tables(config) == {
+        "customers": frozenset({"orders", "addresses"}),
+        "orders": frozenset({"order_lines"}),
+    }
+
+
 def test_build_fk_propagation_maps_with_sequences_dict() -> None:
     """Test building FK propagation maps when sequences config contains dict values."""
     # Note: This test uses type: ignore because the actual config schema expects
@@ -1,4 +1,7 @@
+from dataclasses import replace
+
 import pandas as pd
+import pytest
 
 from src.config.loader import DatabaseConfig, ImportConfig
 from src.excel.reader import normalize_sheet
@@ -47,3 +50,71 @@ def test_convert_config_to_domain_mappings_propagates_null_sentinels():
     mappings = _convert_config_to_domain_mappings(raw)
     m = mappings["SHEET1"]
     assert m.null_sentinels == {"NULL", "« NULL »"}
+
+
+def test_convert_config_to_domain_mappings_is_read_only():
+    raw = ImportConfig(
+        source_directory="./data",
+        sheet_mappings={"SHEET1": {"table": "t_sheet1"}},
+        sequences={},
+        fk_propagations={},
+        timezone="UTC",
+        database=DatabaseConfig(
+            host=None, port=None, user=None, password=None, database=None, dsn=None
+        ),
+    )
+    mappings = _convert_config_to_domain_mappings(raw)
+    with pytest.raises(TypeError):
+        mappings["OTHER"] = mappings["SHEET1"]  # type: ignore[index]
+
+
+def _raw_config(**mapping):
+    return ImportConfig(
+        source_directory="./data",
+        sheet_mappings={"SHEET1": {"table": "t_sheet1", **mapping}},
+        sequences={},
+        fk_propagations={},
+        timezone="UTC",
+        database=DatabaseConfig(
+            host=None, port=None, user=None, password=None, database=None, dsn=None
+        ),
+    )
+
+
+def test_convert_config_to_domain_mappings_cached_by_content():
+    first = _convert_config_to_domain_mappings(_raw_config())
+    # 内容が同一の別 config オブジェクト -> 変換結果を再利用
+    assert _convert_config_to_domain_mappings(_raw_config()) is first
+    changed = _convert_config_to_domain_mappings(_raw_config(sequence_columns=["id"]))
+    assert changed is not first
+    assert changed["SHEET1"].sequence_columns == {"id"}
+
+
+def test_cached_domain_mappings_are_immutable():
+    """Cached mappings are shared across runs, so their containers must not be mutable."""
+    defaults = {"status": "NEW"}
+    raw = _raw_config(sequence_columns=["id"], blob_columns=["img"], default_values=defaults)
+    sheet = _convert_config_to_domain_mappings(raw)["SHEET1"]
+
+    with pytest.raises(AttributeError):
+        sheet.sequence_columns.add("other")  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError):
+        sheet.blob_columns.add("other")  # type: ignore[union-attr]
+    with pytest.raises(TypeError):
+        sheet.default_values["status"] = "DONE"  # type: ignore[index]
+    # 元の config dict を書き換えてもキャッシュ済みの値には波及しない
+    defaults["status"] = "DONE"
+    assert sheet.default_values["status"] == "NEW"  # type: ignore[index]
+
+
+def test_convert_config_to_domain_mappings_cache_respects_sheet_order():
+    """Mapping order is the insert order (parent before child), so it is part of the key."""
+    def config(*sheets: str) -> ImportConfig:
+        return replace(_raw_config(), sheet_mappings={s: {"table": s.lower()} for s in sheets})
+
+    child_first = _convert_config_to_domain_mappings(config("Child", "Parent"))
+    parent_first = _convert_config_to_domain_mappings(config("Parent", "Child"))
+
+    assert child_first is not parent_first
+    assert list(child_first) == ["Child", "Parent"]
+    assert list(parent_first) == ["Parent", "Child"]
@@ -3,11 +3,28 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
 import pytest
 
 from src.config.loader import load_config
+from src.excel.reader import normalize_sheet
+from src.logging.error_log import ErrorLogBuffer
 from src.models.processing_result import ProcessingResult
-from src.services.orchestrator import ProcessingError, process_all, scan_excel_files
+from src.services.orchestrator import (
+    ProcessingError,
+    _convert_config_to_domain_mappings,
+    _diagnose_table_columns,
+    _fill_fk_nulls,
+    _index_fk_maps_by_child_column,
+    _make_sheet_logger,
+    _prefetch_workbooks,
+    _prewarm_table_columns,
+    _sheet_columns_data,
+    _zip_insert_rows,
+    clear_table_columns_cache,
+    process_all,
+    scan_excel_files,
+)
 
 
 def test_scan_excel_files_success(temp_workdir: Path) -> None:
@@ -27,6 +44,31 @@ def test_scan_excel_files_success(temp_workdir: Path) -> None:
     assert file_names == {"customers.xlsx", "orders.xlsx"}
 
 
+def test_scan_excel_files_skips_directories(temp_workdir: Path) -> None:
+    """Entries named *.xlsx that are not regular files are ignored."""
+    data_dir = temp_workdir / "data"
+    (data_dir / "nested.xlsx").mkdir()
+    (data_dir / "real.xlsx").write_bytes(b"test")
+
+    assert scan_excel_files(data_dir) == [data_dir / "real.xlsx"]
+
+
+def test_process_all_progress_total_counts_only_files(
+    temp_workdir: Path, write_config: Path
+) -> None:
+    """The progress total comes from the same is_file()-filtered scan as processing."""
+    data_dir = temp_workdir / "data"
+    (data_dir / "nested.xlsx").mkdir()
+    (data_dir / "real.xlsx").write_bytes(b"test")
+
+    with patch('src.services.orchestrator.ProgressTracker') as tracker, \
+         patch('src.services.orchestrator.read_excel_file', side_effect=ValueError("corrupt")):
+        result = process_all(load_config(write_config))
+
+    assert tracker.call_args[0][0] == 1
+    assert result.failed_files == 1
+
+
 def test_scan_excel_files_directory_not_found() -> None:
     """Test scanning non-existent directory."""
     non_existent = Path("/non/existent/path")
@@ -46,6 +88,281 @@ def test_scan_excel_files_empty_directory(temp_workdir: Path) -> None:
     assert len(files) == 0
 
 
+def test_make_sheet_logger_binds_file_and_sheet() -> None:
+    """Bound logger appends ErrorRecord with pre-bound file/sheet and default row=-1."""
+    buf = ErrorLogBuffer()
+    log = _make_sheet_logger("a.xlsx", "Customers", buf)
+
+    log("SHEET_VALIDATION_ERROR", ValueError("bad header"))
+    message = log("DATABASE_INSERT_ERROR", RuntimeError("boom"), row=5)
+
+    first, second = buf._records
+    assert message is second.db_message
+    assert (first.file, first.sheet, first.row) == ("a.xlsx", "Customers", -1)
+    assert first.error_type == "SHEET_VALIDATION_ERROR"
+    assert first.db_message == "bad header"
+    assert second.row == 5
+    assert second.db_message == "boom"
+
+
+def test_prefetch_workbooks_preserves_order_and_errors() -> None:
+    """Background reader yields results in input order; read errors are passed through."""
+    paths = [Path("a.xlsx"), Path("bad.xlsx"), Path("c.xlsx")]
+
+    def fake_read(path, target_sheets=None):
+        if path.name == "bad.xlsx":
+            raise ValueError("corrupt")
+        return {"S": path.name}
+
+    with patch('src.services.orchestrator.read_excel_file', side_effect=fake_read):
+        items = list(_prefetch_workbooks(paths, frozenset({"S"})))
+
+    assert [p for p, _ in items] == paths
+    assert items[0][1] == {"S": "a.xlsx"}
+    assert isinstance(items[1][1], ValueError)
+
+
+def test_prefetch_workbooks_parallel_reads_keep_order() -> None:
+    """With several workers, reads overlap but results still come back in input order."""
+    import threading
+    import time
+
+    paths = [Path(f"f{i}.xlsx") for i in range(6)]
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def fake_read(path, target_sheets=None):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02 if path.name == "f0.xlsx" else 0.005)
+        with lock:
+            active -= 1
+        return {"S": path.name}
+
+    with patch('src.services.orchestrator.read_excel_file', side_effect=fake_read):
+        items = list(_prefetch_workbooks(paths, frozenset({"S"}), workers=3))
+
+    assert [p for p, _ in items] == paths
+    assert peak > 1
+
+
+def test_prefetch_workbooks_process_workers_read_real_files(tmp_path: Path) -> None:
+    """Process workers parse workbooks and pickle the sheets back in input order."""
+    import pandas as pd
+
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"f{i}.xlsx"
+        pd.DataFrame({"a": ["a", i]}).to_excel(path, sheet_name="S", index=False)
+        paths.append(path)
+    paths.append(tmp_path / "missing.xlsx")
+
+    items = list(_prefetch_workbooks(paths, frozenset({"S"}), workers=2, use_processes=True))
+
+    assert [p for p, _ in items] == paths
+    assert items[2][1]["S"].iloc[2, 0] == 2
+    assert isinstance(items[3][1], FileNotFoundError)
+
+
+def test_prefetch_workbooks_early_close_releases_worker() -> None:
+    """Closing the generator early stops the reader thread instead of blocking."""
+    paths = [Path(f"f{i}.xlsx") for i in range(10)]
+    with patch('src.services.orchestrator.read_excel_file', return_value={}):
+        gen = _prefetch_workbooks(paths, frozenset(), depth=1)
+        next(gen)
+        gen.close()  # joins the worker; would hang if the producer stayed blocked
+
+
+@pytest.mark.parametrize(
+    ("columns", "expected"),
+    [
+        (["id", "name"], [(1, "Alice"), (2, None)]),
+        (["name"], [("Alice",), (None,)]),
+        ([], [(), ()]),
+    ],
+)
+def test_insert_rows_from_row_major_sheet(columns: list[str], expected: list[tuple]) -> None:
+    """Row-major inputs are transposed once; missing keys become None."""
+    sheet = MagicMock(spec=["columns", "rows"])
+    sheet.rows = [{"id": 1, "name": "Alice", "extra": "x"}, {"id": 2}]
+    data, row_count = _sheet_columns_data(sheet, columns)
+    assert _zip_insert_rows(data, columns, row_count) == expected
+
+
+def test_insert_rows_from_column_major_sheet() -> None:
+    """SheetData column lists are selected as-is and zipped into row tuples."""
+    df = pd.DataFrame([["title", None], ["id", "name"], [1, "Alice"], [2, "Bob"]])
+    sheet = normalize_sheet(df, "S")
+    data, row_count = _sheet_columns_data(sheet, ["name", "id"])
+    assert data["name"] is sheet.columns_data["name"]
+    assert _zip_insert_rows(data, ["name", "id"], row_count) == [("Alice", 1), ("Bob", 2)]
+
+
+@pytest.mark.parametrize(
+    ("values", "pks", "expected"),
+    [
+        ([None, 7, None, None], [101, 102], [101, 7, 101, 102]),
+        ([1, 2], [101], [1, 2]),
+        ([None, None], [], [None, None]),
+        ([], [101], []),
+    ],
+)
+def test_fill_fk_nulls_cycles_parent_pks(values: list, pks: list, expected: list) -> None:
+    """None cells take the parent PK at row index modulo parent count."""
+    original = list(values)
+    assert _fill_fk_nulls(values, pks) == expected
+    assert values == original
+
+
+def test_index_fk_maps_by_child_column() -> None:
+    """FK maps are looked up by child column name, with or without a table prefix."""
+    from src.services.fk_propagation import FKPropagationMap
+
+    a = FKPropagationMap("parents", "name", "parent_id", "id")
+    b = FKPropagationMap("others", "code", "children.parent_id", "id")
+    c = FKPropagationMap("owners", "name", "owner_id", "id")
+    index = _index_fk_maps_by_child_column([a, b, c])
+    assert index == {"parent_id": [a, b], "owner_id": [c]}
+
+
+def test_domain_mappings_precompute_parent_pk_columns(write_config: Path) -> None:
+    """PK column resolution from sequences happens once at mapping conversion."""
+    config = load_config(write_config)
+    config.sheet_mappings["Parents"] = {"table": "parents"}
+    config.sequences["parents.pid"] = "parents_pid_seq"
+
+    mappings = _convert_config_to_domain_mappings(config)
+
+    assert mappings["Parents"].returning_pk_column == "pid"
+    assert mappings["Parents"].pk_candidates == ("id", "pid")
+    assert mappings["Customers"].returning_pk_column is None
+    assert mappings["Customers"].pk_candidates == ("id",)
+
+
+def test_table_columns_prewarm_avoids_per_sheet_catalog_queries(caplog) -> None:
+    """One batched catalog query serves later per-table diagnostics."""
+    clear_table_columns_cache()
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [("customers", "id"), ("customers", "name")]
+
+    _prewarm_table_columns(cursor, ["customers", "orders"])
+    _diagnose_table_columns(cursor, "customers", ["name", "email"])
+    _diagnose_table_columns(cursor, "orders", ["id"])
+
+    assert cursor.execute.call_count == 1
+    assert "table=customers existing_cols=2 missing=['email']" in caplog.text
+    assert "table=orders existing_cols=0" in caplog.text
+    clear_table_columns_cache()
+
+
+def test_diagnose_table_columns_caches_per_table() -> None:
+    """Without prewarm, each table is queried once and then cached."""
+    clear_table_columns_cache()
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [("id",)]
+
+    _diagnose_table_columns(cursor, "t", ["id"])
+    _diagnose_table_columns(cursor, "t", ["id"])
+
+    assert cursor.execute.call_count == 1
+    clear_table_columns_cache()
+
+
+def test_sheet_diagnostics_off_by_default(temp_workdir: Path, write_config: Path, capsys) -> None:
+    """Without diagnostics/DEBUG no catalog queries run and nothing is printed."""
+    config = load_config(write_config)
+    assert config.diagnostics is False
+    (temp_workdir / "data" / "a.xlsx").touch()
+    cursor = MagicMock()
+
+    with patch('src.services.orchestrator.read_excel_file') as mock_read, \
+         patch('src.services.orchestrator.normalize_sheet') as mock_norm, \
+         patch('src.services.orchestrator.batch_insert') as mock_insert, \
+         patch('src.services.orchestrator._diagnose_table_columns') as mock_diag:
+        mock_read.return_value = {"Customers": MagicMock()}
+        mock_norm.return_value = MagicMock(rows=[{"name": "A"}], columns=["name"])
+        mock_insert.return_value = MagicMock(inserted_rows=1, returned_values=None)
+        process_all(config, cursor=cursor)
+
+    mock_diag.assert_not_called()
+    executed = [c.args[0] for c in cursor.execute.call_args_list]
+    assert not any("information_schema" in sql for sql in executed)
+    assert "[TRACE]" not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("row_count", "returning", "expect_copy"),
+    [(500, False, True), (499, False, False), (500, True, False)],
+)
+def test_large_sheet_without_returning_uses_copy(
+    temp_workdir: Path, write_config: Path, row_count: int, returning: bool, expect_copy: bool
+) -> None:
+    """Sheets at/above copy_threshold that need no RETURNING go through COPY (opt-in)."""
+    from dataclasses import replace
+
+    config = replace(load_config(write_config), copy_threshold=500)
+    if returning:
+        config.fk_propagations["customers.name"] = "orders.customer_id"
+    (temp_workdir / "data" / "a.xlsx").touch()
+    rows = [{"name": f"n{i}"} for i in range(row_count)]
+
+    with patch('src.services.orchestrator.read_excel_file') as mock_read, \
+         patch('src.services.orchestrator.normalize_sheet') as mock_norm, \
+         patch('src.services.orchestrator.batch_insert') as mock_insert, \
+         patch('src.services.orchestrator.copy_insert') as mock_copy:
+        mock_read.return_value = {"Customers": MagicMock()}
+        mock_norm.return_value = MagicMock(rows=rows, columns=["name"])
+        mock_insert.return_value = MagicMock(inserted_rows=row_count, returned_values=None)
+        mock_copy.return_value = MagicMock(inserted_rows=row_count, returned_values=None)
+        result = process_all(config, cursor=MagicMock())
+
+    assert mock_copy.called is expect_copy
+    assert mock_insert.called is not expect_copy
+    assert result.total_inserted_rows == row_count
+
+
+def test_copy_disabled_by_default(temp_workdir: Path, write_config: Path) -> None:
+    """Without copy_threshold in the config every sheet keeps using execute_values."""
+    config = load_config(write_config)
+    assert config.copy_threshold == 0
+    (temp_workdir / "data" / "a.xlsx").touch()
+    rows = [{"name": f"n{i}"} for i in range(5000)]
+
+    with patch('src.services.orchestrator.read_excel_file',
+               return_value={"Customers": MagicMock()}), \
+         patch('src.services.orchestrator.normalize_sheet',
+               return_value=MagicMock(rows=rows, columns=["name"])), \
+         patch('src.services.orchestrator.batch_insert') as mock_insert, \
+         patch('src.services.orchestrator.copy_insert') as mock_copy:
+        mock_insert.return_value = MagicMock(inserted_rows=len(rows), returned_values=None)
+        process_all(config, cursor=MagicMock())
+
+    assert mock_insert.called
+    assert not mock_copy.called
+
+
+def test_page_size_comes_from_config(temp_workdir: Path, write_config: Path) -> None:
+    """execute_values page size follows config.page_size (default 1000, R-006)."""
+    from dataclasses import replace
+
+    config = load_config(write_config)
+    assert config.page_size == 1000
+    (temp_workdir / "data" / "a.xlsx").touch()
+
+    with patch('src.services.orchestrator.read_excel_file',
+               return_value={"Customers": MagicMock()}), \
+         patch('src.services.orchestrator.normalize_sheet',
+               return_value=MagicMock(rows=[{"name": "A"}], columns=["name"])), \
+         patch('src.services.orchestrator.batch_insert') as mock_insert:
+        mock_insert.return_value = MagicMock(inserted_rows=1, returned_values=None)
+        process_all(replace(config, page_size=250), cursor=MagicMock())
+
+    assert mock_insert.call_args.kwargs["page_size"] == 250
+
+
 def test_process_all_empty_directory(temp_workdir: Path, write_config: Path) -> None:
     """Test processing empty directory (FR-025)."""
     config = load_config(write_config)
@@ -142,6 +459,25 @@ def test_process_all_partial_failure(temp_workdir: Path, write_config: Path) ->
     assert "failed" in statuses
 
 
+@pytest.mark.parametrize(
+    ("exc", "expect_critical"),
+    [(OSError("disk gone"), False), (RuntimeError("bug"), True)],
+)
+def test_process_all_flags_unexpected_file_errors(
+    temp_workdir: Path, write_config: Path, caplog, exc: Exception, expect_critical: bool
+) -> None:
+    """Expected file errors fail quietly; unexpected types are logged as CRITICAL."""
+    config = load_config(write_config)
+    (temp_workdir / "data" / "broken.xlsx").write_bytes(b"test")
+
+    with patch('src.services.orchestrator.read_excel_file', side_effect=exc):
+        result = process_all(config, cursor=None)
+
+    assert result.failed_files == 1
+    criticals = [r for r in caplog.records if r.levelname == "CRITICAL"]
+    assert bool(criticals) is expect_critical
+
+
 def test_process_all_with_database_transaction_rollback(
     temp_workdir: Path, write_config: Path
 ) -> None:
@@ -197,6 +533,90 @@ def test_process_all_with_database_transaction_rollback(
     assert result.total_inserted_rows == 1  # Only from successful file
 
 
+def _tx_statements(mock_cursor: MagicMock) -> list[str]:
+    keywords = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+    return [
+        c[0][0] for c in mock_cursor.execute.call_args_list
+        if isinstance(c[0][0], str) and c[0][0].startswith(keywords)
+    ]
+
+
+def test_process_all_files_per_transaction_uses_savepoints(
+    temp_workdir: Path, write_config: Path
+) -> None:
+    """files_per_transaction groups files under one COMMIT with per-file savepoints."""
+    from dataclasses import replace
+
+    config = replace(load_config(write_config), files_per_transaction=2)
+    data_dir = temp_workdir / "data"
+    for name in ("a.xlsx", "b_broken.xlsx", "c.xlsx"):
+        (data_dir / name).write_bytes(b"test")
+
+    mock_cursor = MagicMock()
+    mock_sheet_data = MagicMock()
+    mock_sheet_data.columns = ["id", "name"]
+    mock_sheet_data.rows = [{"id": 1, "name": "Test"}]
+
+    def mock_read_side_effect(path, target_sheets=None):
+        if "broken" in str(path):
+            raise ValueError("corrupt")
+        return {"Customers": MagicMock()}
+
+    with patch('src.services.orchestrator.scan_excel_files',
+               return_value=sorted(data_dir.iterdir())), \
+         patch('src.services.orchestrator.read_excel_file', side_effect=mock_read_side_effect), \
+         patch('src.services.orchestrator.normalize_sheet', return_value=mock_sheet_data), \
+         patch('src.services.orchestrator.batch_insert',
+               return_value=MagicMock(inserted_rows=1, returned_values=None)):
+        result = process_all(config, cursor=mock_cursor)
+
+    assert _tx_statements(mock_cursor) == [
+        "BEGIN",
+        "SAVEPOINT file_0", "RELEASE SAVEPOINT file_0",
+        "SAVEPOINT file_1", "ROLLBACK TO SAVEPOINT file_1",
+        "COMMIT",
+        "BEGIN",
+        "SAVEPOINT file_2", "RELEASE SAVEPOINT file_2",
+        "COMMIT",
+    ]
+    assert result.success_files == 2
+    assert result.failed_files == 1
+    assert result.total_inserted_rows == 2
+
+
+def test_process_all_group_commit_failure_demotes_files(
+    temp_workdir: Path, write_config: Path
+) -> None:
+    """A failed group COMMIT marks every file of that group as failed."""
+    from dataclasses import replace
+
+    config = replace(load_config(write_config), files_per_transaction=2)
+    data_dir = temp_workdir / "data"
+    (data_dir / "a.xlsx").write_bytes(b"test")
+    (data_dir / "b.xlsx").write_bytes(b"test")
+
+    mock_cursor = MagicMock()
+    def exec_side_effect(sql, *args):
+        if sql == "COMMIT":
+            raise Exception("commit fail")
+    mock_cursor.execute.side_effect = exec_side_effect
+    mock_sheet_data = MagicMock()
+    mock_sheet_data.columns = ["id"]
+    mock_sheet_data.rows = [{"id": 1}]
+
+    with patch('src.services.orchestrator.read_excel_file',
+               return_value={"Customers": MagicMock()}), \
+         patch('src.services.orchestrator.normalize_sheet', return_value=mock_sheet_data), \
+         patch('src.services.orchestrator.batch_insert',
+               return_value=MagicMock(inserted_rows=1, returned_values=None)):
+        result = process_all(config, cursor=mock_cursor)
+
+    assert result.success_files == 0
+    assert result.failed_files == 2
+    assert result.total_inserted_rows == 0
+    assert {s.status for s in result.file_stats} == {"failed"}
+
+
 def test_process_all_transaction_begin_failure(temp_workdir: Path, write_config: Path) -> None:
     """Test T021: Handle failure to begin transaction."""
     config = load_config(write_config)
@@ -352,3 +772,54 @@ def test_process_single_file_with_parent_returning_and_child_fk_propagation(temp
     assert result.success_files == 2
     # 親マップ由来で children も 2 行挿入
     assert result.total_inserted_rows == 4
+
+
+def test_child_fk_filled_from_parent_pk_tuple(temp_workdir: Path, write_config: Path) -> None:
+    """Parent RETURNING PKs are kept in order and reused for child FK None cells."""
+    from src.db.batch_insert import InsertResult
+
+    config = load_config(write_config)
+    config.sheet_mappings['Parents'] = {'table': 'parents', 'sequence_columns': ['id']}
+    config.sheet_mappings['Children'] = {
+        'table': 'children',
+        'sequence_columns': ['id'],
+        'fk_propagation_columns': ['parent_id'],
+    }
+    config.sequences['parents.id'] = 'parents_id_seq'
+    config.fk_propagations['parents.name'] = 'children.parent_id'
+
+    (temp_workdir / 'data' / 'family.xlsx').write_bytes(b"test")
+
+    sheets = {
+        'Parents': MagicMock(
+            spec=['columns', 'rows'],
+            columns=['id', 'name'],
+            rows=[{'id': None, 'name': 'Alice'}, {'id': None, 'name': 'Bob'}],
+        ),
+        'Children': MagicMock(
+            spec=['columns', 'rows'],
+            columns=['id', 'parent_id', 'value'],
+            rows=[{'id': None, 'parent_id': None, 'value': v} for v in (10, 11, 12)],
+        ),
+    }
+    inserted: dict[str, list] = {}
+
+    def fake_insert(cursor, table, columns, rows, returning=False, **kwargs):
+        inserted[table] = list(rows)
+        if returning:
+            # sequences の "parents.id" から PK 列既知 → RETURNING "id" のみ
+            assert kwargs["returning_columns"] == ["id"]
+        returned = [(101, 'Alice'), (102, 'Bob')] if returning else None
+        return InsertResult(inserted_rows=len(rows), returned_values=returned)
+
+    cursor = MagicMock()
+    cursor.description = None  # PK 列既知なので description 推定は不要
+    with patch('src.services.orchestrator.read_excel_file',
+               return_value={'Parents': MagicMock(), 'Children': MagicMock()}), \
+         patch('src.services.orchestrator.normalize_sheet',
+               side_effect=lambda df, sheet_name, **kwargs: sheets[sheet_name]), \
+         patch('src.services.orchestrator.batch_insert', side_effect=fake_insert):
+        result = process_all(config, cursor=cursor)
+
+    assert result.success_files == 1
+    assert inserted['children'] == [(101, 10), (102, 11), (101, 12)]
@@ -7,6 +7,7 @@ import pytest
 from src.models.processing_result import (
     BatchStatsAccumulator,
     FileStat,
+    FileStatsAccumulator,
     MetricsSnapshot,
     ProcessingResult,
 )
@@ -208,6 +209,30 @@ class TestFileStatWithBatchTimings:
         assert stat.p95_batch_seconds == 3.2
 
 
+class TestFileStatsAccumulator:
+    """Test column-wise FileStatsAccumulator."""
+
+    def test_empty_accumulator(self):
+        """Empty accumulator materializes an empty list."""
+        accumulator = FileStatsAccumulator()
+        assert len(accumulator) == 0
+        assert accumulator.to_file_stats() == []
+
+    def test_to_file_stats_preserves_order(self):
+        """Columns are zipped back into FileStat objects in insertion order."""
+        accumulator = FileStatsAccumulator()
+        accumulator.add("a.xlsx", "success", 10, 0.5)
+        accumulator.add("b.xlsx", "failed", 0, 0.25)
+
+        stats = accumulator.to_file_stats()
+
+        assert len(accumulator) == 2
+        assert stats == [
+            FileStat(file_name="a.xlsx", status="success", inserted_rows=10, elapsed_seconds=0.5),
+            FileStat(file_name="b.xlsx", status="failed", inserted_rows=0, elapsed_seconds=0.25),
+        ]
+
+
 class TestBatchStatsAccumulator:
     """Test BatchStatsAccumulator helper class (T029)."""
     
@@ -5,6 +5,8 @@ from unittest.mock import Mock, patch
 
 from src.services.progress import ProgressTracker, SheetProgressIndicator, is_tty_enabled
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 
 def test_is_tty_enabled_returns_stdout_isatty():
     """Test that is_tty_enabled returns sys.stdout.isatty()."""
@@ -15,6 +17,15 @@ def test_is_tty_enabled_returns_stdout_isatty():
         assert is_tty_enabled() is False
 
 
+def test_is_tty_enabled_honors_tqdm_disable(monkeypatch):
+    """TQDM_DISABLE が真値なら TTY でも無効、"0" は無視."""
+    with patch('sys.stdout.isatty', return_value=True):
+        monkeypatch.setenv("TQDM_DISABLE", "1")
+        assert is_tty_enabled() is False
+        monkeypatch.setenv("TQDM_DISABLE", "0")
+        assert is_tty_enabled() is True
+
+
 class TestProgressTracker:
     """Test cases for ProgressTracker class."""
     
@@ -40,6 +51,7 @@ class TestProgressTracker:
                 position=0,
                 ncols=80,
                 ascii=True,
+                mininterval=1.0,
             )
     
     def test_init_with_tty_disabled(self):
@@ -66,7 +78,10 @@ class TestProgressTracker:
             tracker.start_file(file_path)
             
             assert tracker.current_file == 1
-            mock_pbar.set_description.assert_called_once_with("Processing (test.xlsx)")
+            mock_pbar.set_description.assert_called_once_with(
+                "Processing (test.xlsx)", refresh=False
+            )
+            mock_pbar.refresh.assert_not_called()
     
     def test_start_file_with_tty_disabled(self):
         """Test start_file when TTY is disabled."""
@@ -90,8 +105,9 @@ class TestProgressTracker:
             
             tracker.finish_file(success=True)
             
+            # Redraw is left to update() (gated by mininterval)
             mock_pbar.update.assert_called_once_with(1)
-            mock_pbar.set_description.assert_called_once_with("Processing")
+            mock_pbar.set_description.assert_not_called()
     
     def test_finish_file_with_tty_disabled(self):
         """Test finish_file when TTY is disabled."""
@@ -112,7 +128,9 @@ class TestProgressTracker:
             tracker = ProgressTracker(3)
             tracker.set_postfix(success=2, failed=0, rows=100)
             
-            mock_pbar.set_postfix.assert_called_once_with(success=2, failed=0, rows=100)
+            mock_pbar.set_postfix.assert_called_once_with(
+                refresh=False, success=2, failed=0, rows=100
+            )
     
     def test_set_postfix_with_tty_disabled(self):
         """Test set_postfix when TTY is disabled."""
@@ -130,8 +148,10 @@ class TestProgressTracker:
              patch('src.services.progress.tqdm', return_value=mock_pbar):
             
             tracker = ProgressTracker(3)
+            tracker.start_file(Path("test.xlsx"))
             tracker.close()
             
+            mock_pbar.set_description.assert_called_with("Processing files", refresh=False)
             mock_pbar.close.assert_called_once()
             assert tracker.pbar is None
     
@@ -170,64 +190,97 @@ class TestSheetProgressIndicator:
             assert indicator.current_sheet == 0
             assert indicator.enabled is True
     
-    def test_start_sheet_with_tty_enabled(self):
-        """Test start_sheet when TTY is enabled."""
-        with patch('src.services.progress.is_tty_enabled', return_value=True), \
-             patch('builtins.print') as mock_print:
+    def test_init_with_explicit_enabled_skips_tty_check(self):
+        """Caller-supplied decision is used without re-checking the TTY."""
+        with patch('src.services.progress.is_tty_enabled') as mock_tty:
+            indicator = SheetProgressIndicator("test.xlsx", 3, enabled=False)
+            
+            assert indicator.enabled is False
+            mock_tty.assert_not_called()
+    
+    def test_start_sheet_with_tty_enabled(self, capsys):
+        """start_sheet defers output; finish_sheet writes the whole line at once."""
+        with patch('src.services.progress.is_tty_enabled', return_value=True):
             
             indicator = SheetProgressIndicator("test.xlsx", 2)
             indicator.start_sheet("Sheet1")
             
             assert indicator.current_sheet == 1
-            mock_print.assert_called_once_with("  Sheet 1/2: Sheet1", end="", flush=True)
+            assert capsys.readouterr().out == ""
+            
+            indicator.finish_sheet(success=True, rows_processed=10)
+            assert capsys.readouterr().out == "  Sheet 1/2: Sheet1 - 10 rows ✓\n"
     
-    def test_start_sheet_with_tty_disabled(self):
+    def test_start_sheet_with_tty_disabled(self, capsys):
         """Test start_sheet when TTY is disabled."""
-        with patch('src.services.progress.is_tty_enabled', return_value=False), \
-             patch('builtins.print') as mock_print:
+        with patch('src.services.progress.is_tty_enabled', return_value=False):
             
             indicator = SheetProgressIndicator("test.xlsx", 2)
             indicator.start_sheet("Sheet1")
             
             assert indicator.current_sheet == 1
-            mock_print.assert_not_called()
+            assert capsys.readouterr().out == ""
     
-    def test_finish_sheet_success_with_rows(self):
+    def test_finish_sheet_success_with_rows(self, capsys):
         """Test finish_sheet with success and rows processed."""
-        with patch('src.services.progress.is_tty_enabled', return_value=True), \
-             patch('builtins.print') as mock_print:
+        with patch('src.services.progress.is_tty_enabled', return_value=True):
             
             indicator = SheetProgressIndicator("test.xlsx", 2)
             indicator.finish_sheet(success=True, rows_processed=100)
             
-            mock_print.assert_called_once_with(" - 100 rows ✓")
+            assert capsys.readouterr().out == " - 100 rows ✓\n"
     
-    def test_finish_sheet_success_without_rows(self):
+    def test_finish_sheet_success_without_rows(self, capsys):
         """Test finish_sheet with success but no rows."""
-        with patch('src.services.progress.is_tty_enabled', return_value=True), \
-             patch('builtins.print') as mock_print:
+        with patch('src.services.progress.is_tty_enabled', return_value=True):
             
             indicator = SheetProgressIndicator("test.xlsx", 2)
             indicator.finish_sheet(success=True, rows_processed=0)
             
-            mock_print.assert_called_once_with(" ✓")
+            assert capsys.readouterr().out == " ✓\n"
     
-    def test_finish_sheet_failure(self):
+    def test_finish_sheet_failure(self, capsys):
         """Test finish_sheet with failure."""
-        with patch('src.services.progress.is_tty_enabled', return_value=True), \
-             patch('builtins.print') as mock_print:
+        with patch('src.services.progress.is_tty_enabled', return_value=True):
             
             indicator = SheetProgressIndicator("test.xlsx", 2)
             indicator.finish_sheet(success=False, rows_processed=50)
             
-            mock_print.assert_called_once_with(" - 50 rows ✗")
+            assert capsys.readouterr().out == " - 50 rows ✗\n"
     
-    def test_finish_sheet_with_tty_disabled(self):
+    def test_finish_sheet_with_tty_disabled(self, capsys):
         """Test finish_sheet when TTY is disabled."""
-        with patch('src.services.progress.is_tty_enabled', return_value=False), \
-             patch('builtins.print') as mock_print:
+        with patch('src.services.progress.is_tty_enabled', return_value=False):
             
             indicator = SheetProgressIndicator("test.xlsx", 2)
             indicator.finish_sheet(success=True, rows_processed=100)
             
-            mock_print.assert_not_called()
\ No newline at end of file
+            assert capsys.readouterr().out == ""
+    
+    def test_has_no_instance_dict(self):
+        """Instances use __slots__ (one indicator is created per file)."""
+        with patch('src.services.progress.is_tty_enabled', return_value=False):
+            assert not hasattr(SheetProgressIndicator("test.xlsx", 1), "__dict__")
+            assert not hasattr(ProgressTracker(1), "__dict__")
+
+
+def test_tqdm_imported_only_when_tty_enabled():
+    """Non-TTY runs never import tqdm; the first enabled tracker loads it."""
+    import subprocess
+    import sys
+    
+    code = (
+        "import sys\n"
+        "from unittest.mock import patch\n"
+        "from src.services.progress import ProgressTracker\n"
+        "with patch('src.services.progress.is_tty_enabled', return_value=False):\n"
+        "    ProgressTracker(1).close()\n"
+        "assert 'tqdm' not in sys.modules\n"
+        "with patch('src.services.progress.is_tty_enabled', return_value=True):\n"
+        "    ProgressTracker(1).close()\n"
+        "assert 'tqdm' in sys.modules\n"
+    )
+    # `src` をインポートできるよう起動ディレクトリに依存せずプロジェクトルートで実行
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, cwd=PROJECT_ROOT
+    )
@@ -191,4 +191,31 @@ def test_sheet_process_complex_scenario():
     assert sheet.inserted_rows == 2
     assert len(sheet.ignored_columns) == 6
     assert "id" in sheet.ignored_columns
-    assert "parent_id" in sheet.ignored_columns
\ No newline at end of file
+    assert "parent_id" in sheet.ignored_columns
+
+def test_sheet_mapping_ignored_columns_cached():
+    """ignored_columns is the sequence/FK union, computed once per mapping."""
+    mapping = SheetMappingConfig(
+        sheet_name="Child",
+        table_name="child",
+        sequence_columns={"id"},
+        fk_propagation_columns={"parent_id"}
+    )
+
+    assert mapping.ignored_columns == frozenset({"id", "parent_id"})
+    assert mapping.ignored_columns is mapping.ignored_columns
+
+
+def test_sheet_mapping_expected_columns_cached():
+    """expected_columns is built once per mapping, not per validated sheet."""
+    mapping = SheetMappingConfig(
+        sheet_name="Child",
+        table_name="child",
+        sequence_columns={"id"},
+        fk_propagation_columns={"parent_id"},
+        default_values={"status": "new"},
+        blob_columns={"photo"},
+    )
+
+    assert mapping.expected_columns == frozenset({"parent_id", "status", "photo"})
+    assert mapping.expected_columns is mapping.expected_columns
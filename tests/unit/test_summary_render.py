@@ -4,7 +4,7 @@ import re
 from datetime import UTC, datetime
 
 from src.models.processing_result import ProcessingResult
-from src.services.summary import render_summary_line
+from src.services.summary import render_summary_fields, render_summary_line
 
 """Unit tests for summary rendering service (T026).
 
@@ -12,15 +12,8 @@ Tests the render_summary_line function against the contract format from
 contracts/summary_output.md.
 """
 
-# Regex pattern from contracts/summary_output.md
-SUMMARY_PATTERN = re.compile(
-    r"^SUMMARY\s+files=([0-9]+)/(\1)\s+success=([0-9]+)\s+failed=([0-9]+)\s+"
-    r"rows=([0-9]+)\s+skipped_sheets=([0-9]+)\s+elapsed_sec=([0-9]+\.?[0-9]*)\s+"
-    r"throughput_rps=([0-9]+\.?[0-9]*)$"
-)
 
-
-def test_render_summary_line_all_success() -> None:
+def test_render_summary_line_all_success(summary_pattern: re.Pattern[str]) -> None:
     """Test SUMMARY rendering for all successful files scenario."""
     start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
     end_time = datetime(2023, 1, 1, 10, 0, 2, tzinfo=UTC)  # 2 seconds elapsed
@@ -39,7 +32,7 @@ def test_render_summary_line_all_success() -> None:
     summary_line = render_summary_line(2, result)
     
     # Should match contract regex
-    match = SUMMARY_PATTERN.match(summary_line)
+    match = summary_pattern.match(summary_line)
     assert match, f"SUMMARY line should match regex: {summary_line}"
     
     # Verify fields
@@ -52,7 +45,7 @@ def test_render_summary_line_all_success() -> None:
     assert match.group(8) == "500"  # throughput_rps (integer formatted without decimal)
 
 
-def test_render_summary_line_partial_failure() -> None:
+def test_render_summary_line_partial_failure(summary_pattern: re.Pattern[str]) -> None:
     """Test SUMMARY rendering for partial failure scenario."""
     start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
     end_time = datetime(2023, 1, 1, 10, 0, 3, tzinfo=UTC)  # 3 seconds elapsed
@@ -71,7 +64,7 @@ def test_render_summary_line_partial_failure() -> None:
     summary_line = render_summary_line(3, result)
     
     # Should match contract regex
-    match = SUMMARY_PATTERN.match(summary_line)
+    match = summary_pattern.match(summary_line)
     assert match, f"SUMMARY line should match regex: {summary_line}"
     
     # Verify fields
@@ -84,7 +77,7 @@ def test_render_summary_line_partial_failure() -> None:
     assert match.group(8) == "166.67"  # throughput_rps
 
 
-def test_render_summary_line_zero_files() -> None:
+def test_render_summary_line_zero_files(summary_pattern: re.Pattern[str]) -> None:
     """Test SUMMARY rendering for zero files scenario."""
     start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
     end_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)  # 0 seconds elapsed
@@ -103,7 +96,7 @@ def test_render_summary_line_zero_files() -> None:
     summary_line = render_summary_line(0, result)
     
     # Should match contract regex
-    match = SUMMARY_PATTERN.match(summary_line)
+    match = summary_pattern.match(summary_line)
     assert match, f"SUMMARY line should match regex: {summary_line}"
     
     # Verify fields
@@ -116,7 +109,7 @@ def test_render_summary_line_zero_files() -> None:
     assert match.group(8) == "0"  # throughput_rps
 
 
-def test_render_summary_line_decimal_precision() -> None:
+def test_render_summary_line_decimal_precision(summary_pattern: re.Pattern[str]) -> None:
     """Test SUMMARY rendering handles decimal precision correctly."""
     start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
     end_time = datetime(2023, 1, 1, 10, 0, 0, 840000, tzinfo=UTC)  # 0.84 seconds
@@ -135,7 +128,7 @@ def test_render_summary_line_decimal_precision() -> None:
     summary_line = render_summary_line(1, result)
     
     # Should match contract regex
-    match = SUMMARY_PATTERN.match(summary_line)
+    match = summary_pattern.match(summary_line)
     assert match, f"SUMMARY line should match regex: {summary_line}"
     
     # This should produce the exact line from the contract example
@@ -146,7 +139,7 @@ def test_render_summary_line_decimal_precision() -> None:
     assert summary_line == expected
 
 
-def test_render_summary_line_integer_elapsed_time() -> None:
+def test_render_summary_line_integer_elapsed_time(summary_pattern: re.Pattern[str]) -> None:
     """Test SUMMARY rendering with integer elapsed time (no decimal point)."""
     start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
     end_time = datetime(2023, 1, 1, 10, 0, 5, tzinfo=UTC)  # 5 seconds elapsed
@@ -165,7 +158,7 @@ def test_render_summary_line_integer_elapsed_time() -> None:
     summary_line = render_summary_line(1, result)
     
     # Should match contract regex
-    match = SUMMARY_PATTERN.match(summary_line)
+    match = summary_pattern.match(summary_line)
     assert match, f"SUMMARY line should match regex: {summary_line}"
     
     # Integer elapsed time should be formatted as "5" not "5.0"
@@ -173,7 +166,7 @@ def test_render_summary_line_integer_elapsed_time() -> None:
     assert "throughput_rps=200" in summary_line  # No trailing space since it's at end of line
 
 
-def test_render_summary_line_formats_numbers_correctly() -> None:
+def test_render_summary_line_formats_numbers_correctly(summary_pattern: re.Pattern[str]) -> None:
     """Test that numeric formatting meets contract requirements."""
     start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
     end_time = datetime(2023, 1, 1, 10, 0, 1, 500000, tzinfo=UTC)  # 1.5 seconds
@@ -192,7 +185,7 @@ def test_render_summary_line_formats_numbers_correctly() -> None:
     summary_line = render_summary_line(3, result)
     
     # Should match contract regex
-    match = SUMMARY_PATTERN.match(summary_line)
+    match = summary_pattern.match(summary_line)
     assert match, f"SUMMARY line should match regex: {summary_line}"
     
     # All integers should be formatted without decimals
@@ -203,7 +196,9 @@ def test_render_summary_line_formats_numbers_correctly() -> None:
     assert "skipped_sheets=2" in summary_line
 
 
-def test_render_summary_line_handles_very_small_elapsed_time() -> None:
+def test_render_summary_line_handles_very_small_elapsed_time(
+    summary_pattern: re.Pattern[str],
+) -> None:
     """Test SUMMARY rendering handles very small elapsed times without scientific notation."""
     start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
     end_time = datetime(2023, 1, 1, 10, 0, 0, 50, tzinfo=UTC)  # 50 microseconds
@@ -222,7 +217,7 @@ def test_render_summary_line_handles_very_small_elapsed_time() -> None:
     summary_line = render_summary_line(0, result)
     
     # Should match contract regex (no scientific notation)
-    match = SUMMARY_PATTERN.match(summary_line)
+    match = summary_pattern.match(summary_line)
     assert match, f"SUMMARY line should match regex: {summary_line}"
     
     # Should not contain scientific notation
@@ -230,4 +225,46 @@ def test_render_summary_line_handles_very_small_elapsed_time() -> None:
     assert "e+" not in summary_line
     
     # Should format very small number appropriately
-    assert "elapsed_sec=0.00005" in summary_line
\ No newline at end of file
+    assert "elapsed_sec=0.00005" in summary_line
+
+
+def test_render_summary_line_small_throughput_uses_fixed_notation(
+    summary_pattern: re.Pattern[str],
+) -> None:
+    """Throughput below 0.01 is formatted like elapsed_sec (no scientific notation)."""
+    start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
+    end_time = datetime(2023, 1, 1, 15, 33, 20, tzinfo=UTC)
+    
+    result = ProcessingResult(
+        success_files=1,
+        failed_files=0,
+        total_inserted_rows=1,
+        skipped_sheets=0,
+        start_time=start_time,
+        end_time=end_time,
+        elapsed_seconds=20000.0,
+        throughput_rows_per_sec=0.00005,  # repr() would give 5e-05
+    )
+    
+    summary_line = render_summary_line(1, result)
+    
+    assert summary_pattern.match(summary_line), summary_line
+    assert "e-" not in summary_line
+    assert summary_line.endswith("throughput_rps=0.00005")
+
+
+def test_render_summary_fields_is_line_without_prefix() -> None:
+    """render_summary_fields (used with log_summary) is the SUMMARY line body."""
+    start_time = datetime(2023, 1, 1, 10, 0, 0, tzinfo=UTC)
+    result = ProcessingResult(
+        success_files=1,
+        failed_files=0,
+        total_inserted_rows=4,
+        skipped_sheets=0,
+        start_time=start_time,
+        end_time=start_time,
+        elapsed_seconds=0.84,
+        throughput_rows_per_sec=4761.9,
+    )
+    
+    assert render_summary_line(1, result) == f"SUMMARY {render_summary_fields(1, result)}"